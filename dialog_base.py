@@ -1,6 +1,7 @@
 import abc
+from functools import lru_cache
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QDialog,
@@ -18,17 +19,38 @@ from PyQt5.QtWidgets import (
 qt_meta = type(QDialog)
 
 
+@lru_cache(maxsize=64)
+def _decimals_for_step(step: float) -> int:
+    """Number of decimals a spin box needs to display multiples of 'step'."""
+    if isinstance(step, int) or step == 0:
+        decimals = 0
+    elif "e" in f"{step:.10e}":  # Use scientific notation to find order of magnitude
+        decimals = abs(int(f"{step:.10e}".split("e")[-1]))
+    else:
+        decimals = len(str(float(step)).split(".")[-1])
+    return min(decimals, 10)  # Limit decimals for sanity
+
+
 class BaseDialog(QDialog):
     """Base class for parameter input dialogs."""
 
     parameter_changed = pyqtSignal()
 
+    # Quiet period after the last slider/spin box change before parameter_changed fires
+    PARAMETER_DEBOUNCE_MS = 50
+
     def __init__(self, parent=None, window_title="Parameters", min_width=350):
         super().__init__(parent)
         self.setWindowTitle(window_title)
         self.setModal(True)
         self.setMinimumWidth(min_width)
 
+        # Coalesces bursts of value changes (e.g. a slider drag) into one signal
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.PARAMETER_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self.parameter_changed.emit)
+
         self.main_layout = QVBoxLayout(self)
         self.param_layout = (
             QVBoxLayout()
@@ -101,8 +123,8 @@ class BaseDialog(QDialog):
         slider.valueChanged.connect(spin.setValue)
         spin.valueChanged.connect(slider.setValue)
 
-        # Emit parameter_changed signal when value changes
-        spin.valueChanged.connect(self.parameter_changed.emit)
+        # Emit parameter_changed (debounced) when value changes
+        spin.valueChanged.connect(self._debounce_timer.start)
 
         h_layout.addWidget(slider)
         h_layout.addWidget(spin)
@@ -131,19 +153,11 @@ class BaseDialog(QDialog):
 
         # Calculate decimals if not provided
         if decimals is None:
-            if isinstance(step, int) or step == 0:
-                decimals = 0
-            elif (
-                "e" in f"{step:.10e}"
-            ):  # Use scientific notation to find order of magnitude
-                decimals = abs(int(f"{step:.10e}".split("e")[-1]))
-            else:
-                decimals = len(str(float(step)).split(".")[-1])
-            decimals = min(decimals, 10)  # Limit decimals for sanity
+            decimals = _decimals_for_step(step)
         spin.setDecimals(decimals)
 
-        # Emit parameter_changed signal when value changes
-        spin.valueChanged.connect(self.parameter_changed.emit)
+        # Emit parameter_changed (debounced) when value changes
+        spin.valueChanged.connect(self._debounce_timer.start)
 
         # Slider setup (handle potential division by zero)
         if abs(step) > 1e-9:
@@ -176,6 +190,6 @@ class BaseDialog(QDialog):
     def _add_info_label(self, layout: QVBoxLayout, text: str):
         """Adds a styled informational label to the layout."""
         info_label = QLabel(text)
-        info_label.setStyleSheet("color: gray; font-style: italic;")
+        info_label.setObjectName("DialogInfoLabel")  # Styled by the main style sheet
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
@@ -1,7 +1,12 @@
+import sys
+import weakref
+import zlib
+from collections import deque, namedtuple
+from dataclasses import dataclass, replace
+
 # Type hinting for MainWindow without circular import
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Union
 
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction, QMessageBox, QMenu
 import numpy as np
 
@@ -17,13 +22,23 @@ from edge_detection_operations import (
     ScharrOperation,
     SobelOperation,
 )
-from handler_base import BaseActionsHandler  # Import new base class
+from handler_base import BaseActionsHandler, cached_icon  # Import new base class
 from segmentation_operations import (
     ChanVeseOperation,
     MorphSnakesOperation,
     MultiOtsuOperation,
 )
 
+try:
+    import lz4.block as lz4_block
+except ImportError:  # lz4 is optional, history compression falls back to zlib
+    lz4_block = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, history entries are then not deduplicated
+    xxhash = None
+
 # Assuming MainWindow has methods: _clearSource, _clearOutput, _undo, _redo
 # Assuming MainWindow has attributes: undo_stack, redo_stack, style()
 
@@ -31,11 +46,154 @@ if TYPE_CHECKING:
     from gui import MainWindow
 
 
+# A cold history entry's pixels, compressed. 'kind' is "raw" for the image
+# bytes, "delta" for an XOR delta against the entry directly above it in the
+# stack, or "bits" for a 0/255 mask packed to one bit per pixel
+_EncodedImage = namedtuple("_EncodedImage", "blob shape dtype kind")
+
+
+def _compress(data) -> bytes:
+    if lz4_block is not None:
+        return lz4_block.compress(data, mode="fast", store_size=True)
+    return zlib.compress(data, 1)
+
+
+def _decompress(blob: bytes) -> bytes:
+    if lz4_block is not None:
+        return lz4_block.decompress(blob)
+    return zlib.decompress(blob)
+
+
+def _as_bytes(image_data: np.ndarray) -> np.ndarray:
+    """Flat uint8 view of an image's memory (copies only if not contiguous)."""
+    return np.ascontiguousarray(image_data).reshape(-1).view(np.uint8)
+
+
+def _is_binary_mask(image_data: np.ndarray) -> bool:
+    """True for 2D uint8 images holding only 0 and 255 (threshold/segmentation masks)."""
+    if image_data.dtype != np.uint8 or image_data.ndim != 2:
+        return False
+    # Cheap sparse sample first, so ordinary grayscale images bail out early
+    sample = image_data[::32, ::32]
+    if not np.all((sample == 0) | (sample == 255)):
+        return False
+    return bool(np.all((image_data == 0) | (image_data == 255)))
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """One undo/redo state: the output image and the output title shown with it."""
+
+    # Declared by hand rather than with dataclass(slots=True), which needs 3.10
+    __slots__ = ("image", "title")
+
+    # An array when hot, an _EncodedImage when cold, or None for an empty state
+    image: Union[np.ndarray, _EncodedImage, None]
+    title: str
+
+
+class ImageHistory:
+    """
+    Bounded stack of HistoryEntry states with a deque-like API.
+
+    Only the top HOT_ENTRIES states are kept as arrays; undo/redo touch those
+    without any decoding. Deeper (cold) states are compressed (LZ4 when
+    available, zlib otherwise) as an XOR delta against the state directly above
+    them, or whole when shape or dtype differ. Binary 0/255 masks are packed to
+    one bit per pixel before compressing instead. Because the state above never
+    changes while an entry exists, pushing compresses at most one entry and
+    popping decompresses at most one entry, and evicting the bottom entry
+    needs no re-encoding.
+    """
+
+    HOT_ENTRIES = 2
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._entries = deque()  # HistoryEntry, bottom to top
+        # Reused for XOR deltas so encoding does not allocate an image-sized
+        # temporary on every push; grows to the largest image seen
+        self._scratch = np.empty(0, dtype=np.uint8)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def clear(self):
+        self._entries.clear()
+
+    def append(self, image_data: Optional[np.ndarray], title_string: str):
+        if len(self._entries) >= self.maxlen:
+            self._entries.popleft()
+        # Titles repeat from a small set ("Grayscale", "Sobel Edges", ...);
+        # interning lets every entry share one string object per title
+        self._entries.append(HistoryEntry(image_data, sys.intern(title_string)))
+        cold_index = len(self._entries) - 1 - self.HOT_ENTRIES
+        if cold_index >= 0:
+            entry = self._entries[cold_index]
+            above = self._entries[cold_index + 1].image
+            self._entries[cold_index] = replace(
+                entry, image=self._encode(entry.image, above)
+            )
+
+    def pop(self) -> HistoryEntry:
+        entry = self._entries.pop()
+        warm_index = len(self._entries) - self.HOT_ENTRIES
+        if warm_index >= 0:
+            warm = self._entries[warm_index]
+            above = self._entries[warm_index + 1].image
+            self._entries[warm_index] = replace(
+                warm, image=self._decode(warm.image, above)
+            )
+        return entry
+
+    def _encode(self, image_data, above):
+        if image_data is None:
+            return None
+        if _is_binary_mask(image_data):
+            # packbits treats any nonzero byte as a set bit
+            raw, kind = np.packbits(image_data, axis=None), "bits"
+        elif (
+            above is not None
+            and above.shape == image_data.shape
+            and above.dtype == image_data.dtype
+        ):
+            if self._scratch.size < image_data.nbytes:
+                self._scratch = np.empty(image_data.nbytes, dtype=np.uint8)
+            raw = self._scratch[: image_data.nbytes]
+            np.bitwise_xor(_as_bytes(image_data), _as_bytes(above), out=raw)
+            kind = "delta"
+        else:
+            raw, kind = _as_bytes(image_data), "raw"
+        # The compressors read the array buffer directly, no bytes copy
+        return _EncodedImage(_compress(raw), image_data.shape, image_data.dtype, kind)
+
+    @staticmethod
+    def _decode(encoded, above):
+        if encoded is None:
+            return None
+        raw = np.frombuffer(_decompress(encoded.blob), dtype=np.uint8)
+        if encoded.kind == "bits":
+            count = encoded.shape[0] * encoded.shape[1]
+            raw = np.unpackbits(raw, count=count)
+            raw *= np.uint8(255)
+        elif encoded.kind == "delta":
+            raw = np.bitwise_xor(raw, _as_bytes(above))
+        else:
+            raw = raw.copy()
+        return raw.view(encoded.dtype).reshape(encoded.shape)
+
+
 class EditActionsHandler(BaseActionsHandler):
     """Handles the creation, connection, state, and logic for Edit menu actions.
-    Undo/Redo stack now stores (image_data, title_string) tuples.
+    Undo/Redo stacks store HistoryEntry (image, title) states.
     """
 
+    # Oldest states are dropped once a stack holds this many entries
+    MAX_UNDO_STEPS = 20
+
     def __init__(self, main_window):
         """
         Initializes the handler and creates the actions.
@@ -44,20 +202,24 @@ class EditActionsHandler(BaseActionsHandler):
             main_window: The MainWindow instance.
         """
         super().__init__(main_window)
-        # Stacks now store tuples: (image_numpy_array_copy, title_string)
-        self.undo_stack = []
-        self.redo_stack = []
+        # Stacks take (image_numpy_array, title_string), return HistoryEntry
+        # and evict the oldest entry in O(1) when full
+        self.undo_stack = ImageHistory(self.MAX_UNDO_STEPS)
+        self.redo_stack = ImageHistory(self.MAX_UNDO_STEPS)
+        # Content hash -> read-only snapshot still referenced somewhere, so
+        # identical states pushed again share one array
+        self._blob_pool = weakref.WeakValueDictionary()
         self._create_actions()
         self._connect_actions()
 
     def _create_actions(self):
         """Creates the QAction objects for the Edit menu."""
-        self.undoAction = QAction(QIcon("icons/undo.png"), "&Undo", self.main_window)
+        self.undoAction = QAction(cached_icon("icons/undo.png"), "&Undo", self.main_window)
         self.undoAction.setShortcut("Ctrl+Z")
         self.undoAction.setStatusTip("Undo the last operation")
         self.undoAction.setToolTip("Undo the last operation (Ctrl+Z)")
 
-        self.redoAction = QAction(QIcon("icons/redo.png"), "&Redo", self.main_window)
+        self.redoAction = QAction(cached_icon("icons/redo.png"), "&Redo", self.main_window)
         self.redoAction.setShortcut("Ctrl+Y")
         self.redoAction.setStatusTip("Redo the last undone operation")
         self.redoAction.setToolTip("Redo the last undone operation (Ctrl+Y)")
@@ -86,15 +248,50 @@ class EditActionsHandler(BaseActionsHandler):
 
     # --- Stack Management Methods ---
     def add_to_undo_stack(self, image_data, title_string):
-        """Adds the given image state (a copy) and title to the undo stack."""
-        # Ensure image_data is copied if it's a mutable numpy array
-        # If image_data can be None (e.g. for initial "empty" output state), handle that.
-        img_copy = image_data.copy() if image_data is not None else None
-        self.undo_stack.append((img_copy, title_string))
-        # Optional: Implement max stack size here
-        # MAX_UNDO_STEPS = 20
-        # while len(self.undo_stack) > MAX_UNDO_STEPS:
-        #     self.undo_stack.pop(0)
+        """
+        Adds the given image state and title to the undo stack.
+
+        The array is not copied but marked read-only, making it a copy-on-write
+        snapshot shared with the caller. This relies on operations returning
+        freshly allocated outputs instead of modifying images in place.
+        """
+        # image_data can be None (e.g. for the initial "empty" output state)
+        if image_data is not None:
+            if self._matches_undo_top(image_data, title_string):
+                return  # Same state as the last one; re-applying changed nothing
+            image_data.setflags(write=False)
+            image_data = self._deduplicate(image_data)
+        self.undo_stack.append(image_data, title_string)
+
+    def _matches_undo_top(self, image_data, title_string) -> bool:
+        # A different title is a different state (it names the step and the
+        # export file), even when the pixels are identical
+        if not self.undo_stack or self.undo_stack[-1].title != title_string:
+            return False
+        top_image = self.undo_stack[-1].image  # The top entry is never encoded
+        if top_image is image_data:
+            return True
+        return (
+            top_image is not None
+            and top_image.shape == image_data.shape
+            and top_image.dtype == image_data.dtype
+            and np.array_equal(top_image, image_data)
+        )
+
+    def _deduplicate(self, image_data):
+        """Returns a pooled snapshot with the same content as image_data, if any."""
+        if xxhash is None:
+            return image_data
+        key = xxhash.xxh3_128_digest(_as_bytes(image_data))
+        stored = self._blob_pool.get(key)
+        if (
+            stored is not None
+            and stored.shape == image_data.shape
+            and stored.dtype == image_data.dtype
+        ):
+            return stored
+        self._blob_pool[key] = image_data
+        return image_data
 
     def clear_redo(self):
         if self.redo_stack:
@@ -157,19 +354,23 @@ class EditActionsHandler(BaseActionsHandler):
     def undo(self):
         """Performs the undo operation by restoring image state from the stack."""
         mw = self.main_window
-        if hasattr(mw, 'worker_thread') and mw.worker_thread and mw.worker_thread.isRunning():
+        if mw.operation_handler.is_busy():
             QMessageBox.warning(mw, "Meşgul", "Ana bir işlem çalışırken geri alamazsınız.")
             return
-        # No recompute_thread to check anymore
 
         if self.can_undo():
             # State to restore from undo_stack
-            image_to_restore, title_to_restore = self.undo_stack.pop()
+            restored = self.undo_stack.pop()
+            image_to_restore, title_to_restore = restored.image, restored.title
             
             # Current state to push to redo_stack
-            current_image_for_redo = mw.current_output_image.copy() if mw.current_output_image is not None else None
+            # No copy: the displaced state is only rebound, so it is frozen
+            # read-only and shared with the stack
+            current_image_for_redo = mw.current_output_image
+            if current_image_for_redo is not None:
+                current_image_for_redo.setflags(write=False)
             current_title_for_redo = mw.outputTitleLabel.text() # Get title *before* changing it
-            self.redo_stack.append((current_image_for_redo, current_title_for_redo))
+            self.redo_stack.append(current_image_for_redo, current_title_for_redo)
             
             # Restore state
             mw.current_output_image = image_to_restore # This is already a copy or None from add_to_undo_stack
@@ -186,19 +387,23 @@ class EditActionsHandler(BaseActionsHandler):
     def redo(self):
         """Performs the redo operation by restoring image state from the stack."""
         mw = self.main_window
-        if hasattr(mw, 'worker_thread') and mw.worker_thread and mw.worker_thread.isRunning():
+        if mw.operation_handler.is_busy():
             QMessageBox.warning(mw, "Meşgul", "Ana bir işlem çalışırken yineleyemezsiniz.")
             return
-        # No recompute_thread to check anymore
 
         if self.can_redo():
             # State to restore from redo_stack
-            image_to_restore, title_to_restore = self.redo_stack.pop()
+            restored = self.redo_stack.pop()
+            image_to_restore, title_to_restore = restored.image, restored.title
             
             # Current state to push to undo_stack
-            current_image_for_undo = mw.current_output_image.copy() if mw.current_output_image is not None else None
+            # No copy: the displaced state is only rebound, so it is frozen
+            # read-only and shared with the stack
+            current_image_for_undo = mw.current_output_image
+            if current_image_for_undo is not None:
+                current_image_for_undo.setflags(write=False)
             current_title_for_undo = mw.outputTitleLabel.text() # Get title *before* changing it
-            self.undo_stack.append((current_image_for_undo, current_title_for_undo))
+            self.undo_stack.append(current_image_for_undo, current_title_for_undo)
             
             # Restore state
             mw.current_output_image = image_to_restore # This is already a copy or None
@@ -6,17 +6,115 @@ from typing import TYPE_CHECKING
 
 import imageio  # Use imageio for wider format support
 import numpy as np
-from PyQt5.QtGui import QIcon, QKeySequence
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QKeySequence
 
 # Removed QStyle from import, as _get_std_icon is removed
 from PyQt5.QtWidgets import QAction, QApplication, QFileDialog, QMenu, QMessageBox
-from skimage.util import img_as_ubyte  # Add back the removed import
 
-from handler_base import BaseActionsHandler  # Import new base class
+from handler_base import BaseActionsHandler, cached_icon  # Import new base class
+
+try:
+    import tifffile
+except ImportError:  # tifffile is optional, TIFFs are then read via imageio
+    tifffile = None
 
 if TYPE_CHECKING:
     from gui import MainWindow
 
+# Main directory (the application folder), where outputs are saved by default
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# imageio plugin per extension, so opening a file skips plugin auto-discovery
+_READ_PLUGINS = {
+    ".jpg": "pillow",
+    ".jpeg": "pillow",
+    ".png": "pillow",
+    ".bmp": "pillow",
+}
+if tifffile is not None:
+    _READ_PLUGINS[".tif"] = _READ_PLUGINS[".tiff"] = "tifffile"
+
+# imwrite arguments per extension: an explicit plugin skips auto-discovery, and
+# PNG uses zlib level 3 instead of the default 6 (about twice as fast to encode
+# for a few percent larger files)
+_WRITE_ARGS = {
+    ".png": {"plugin": "pillow", "extension": ".png", "compress_level": 3},
+    ".jpg": {"plugin": "pillow", "extension": ".jpg"},
+    ".jpeg": {"plugin": "pillow", "extension": ".jpeg"},
+    ".bmp": {"plugin": "pillow", "extension": ".bmp"},
+}
+if tifffile is not None:
+    _WRITE_ARGS[".tif"] = _WRITE_ARGS[".tiff"] = {"plugin": "tifffile"}
+
+
+def _read_image(file_name: str) -> np.ndarray:
+    """
+    Reads an image file. Uncompressed TIFFs are memory-mapped read-only instead of
+    loaded, so huge rasters are paged in on demand.
+    """
+    ext = os.path.splitext(file_name)[1].lower()
+    if tifffile is not None and ext in (".tif", ".tiff"):
+        try:
+            return tifffile.memmap(file_name, mode="r")
+        except ValueError:  # Compressed or tiled data cannot be mapped
+            pass
+    plugin = _READ_PLUGINS.get(ext)
+    if plugin is None:
+        return imageio.v3.imread(file_name)
+    return imageio.v3.imread(file_name, plugin=plugin)
+
+
+def _to_saveable(image_data: np.ndarray) -> np.ndarray:
+    """Converts image data to uint8 for writing with imageio."""
+    # Ensure image data is in uint8 format if it's a common type
+    if image_data.dtype == np.bool_:
+        return image_data.view(np.uint8) * np.uint8(255)
+    if np.issubdtype(image_data.dtype, np.floating):
+        # [0, 1] floats are scaled to 0-255, other floats are taken as 0-255
+        # already; clipping before the cast keeps out-of-range values (and
+        # NaN, saved as 0) from wrapping
+        scaled = np.nan_to_num(image_data, nan=0.0, posinf=255.0, neginf=0.0)
+        if scaled.min() >= 0.0 and scaled.max() <= 1.0:
+            scaled *= 255
+        return np.clip(scaled, 0, 255, out=scaled).astype(np.uint8)
+    if image_data.dtype != np.uint8:
+        if image_data.max() <= 1 and image_data.min() >= 0:
+            return (image_data * 255).astype(np.uint8)
+        # Attempt conversion, might need adjustments based on data range
+        return image_data.astype(np.uint8)
+    return image_data
+
+
+class _SaveSignals(QObject):
+    """Signals for _SaveTask (a QRunnable cannot emit itself)."""
+
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class _SaveTask(QRunnable):
+    """Converts and encodes one image to disk on a QThreadPool thread."""
+
+    def __init__(self, image_data: np.ndarray, file_path: str, assume_uint8: bool):
+        super().__init__()
+        self.image_data = image_data
+        self.file_path = file_path
+        self.assume_uint8 = assume_uint8
+        self.signals = _SaveSignals()
+
+    def run(self):
+        try:
+            image_data = self.image_data
+            if not self.assume_uint8:
+                image_data = _to_saveable(image_data)
+            ext = os.path.splitext(self.file_path)[1].lower()
+            imageio.v3.imwrite(
+                self.file_path, image_data, **_WRITE_ARGS.get(ext, {})
+            )
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
 # Assuming MainWindow has attributes:
 # current_source_image, current_output_image, sourceFilePath, outputFilePath,
 # edit_handler, style(), _logMessage(), _updateImageDisplay(), _activateUIComponents(), close()
@@ -25,8 +123,17 @@ if TYPE_CHECKING:
 class FileActionsHandler(BaseActionsHandler):
     """Handles the creation, connection, state, and logic for File menu actions."""
 
+    # File dialog settings shared by every open/save call
+    _DIALOG_OPTIONS = QFileDialog.Options()  # Plain flags, no QApplication needed
+    _OPEN_FILTER = "Image Files (*.jpg *.jpeg *.png *.bmp *.tif *.tiff);;All Files (*)"
+    _SAVE_FILTER = (
+        "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg);;Bitmap Image (*.bmp);;"
+        "TIFF Image (*.tif *.tiff);;All Files (*)"
+    )
+
     def __init__(self, main_window):
         super().__init__(main_window)
+        self._pending_saves = set()  # _SaveTask instances still writing
         self._create_actions()
         self._connect_actions()
 
@@ -35,13 +142,13 @@ class FileActionsHandler(BaseActionsHandler):
         mw = self.main_window  # Alias
 
         # Use icons from icons folder
-        self.openSourceAction = QAction(QIcon("icons/folder.png"), "Open Source...", mw)
+        self.openSourceAction = QAction(cached_icon("icons/folder.png"), "Open Source...", mw)
         self.openSourceAction.setShortcut(QKeySequence.Open)  # Ctrl+O
         self.openSourceAction.setStatusTip("Open an image file (.jpg, .png, etc.)")
         self.openSourceAction.setToolTip("Open an image file")
 
         self.saveOutputAction = QAction(
-            QIcon("icons/save_output.png"), "Save Output", mw
+            cached_icon("icons/save_output.png"), "Save Output", mw
         )
         self.saveOutputAction.setShortcut(QKeySequence.Save)  # Ctrl+S
         self.saveOutputAction.setStatusTip(
@@ -50,7 +157,7 @@ class FileActionsHandler(BaseActionsHandler):
         self.saveOutputAction.setToolTip("Save output to original source path (Ctrl+S)")
 
         self.saveAsOutputAction = QAction(
-            QIcon("icons/save_as.png"), "Save Output As...", mw
+            cached_icon("icons/save_as.png"), "Save Output As...", mw
         )
         self.saveAsOutputAction.setShortcut(QKeySequence.SaveAs)  # Ctrl+Shift+S
         self.saveAsOutputAction.setStatusTip("Save the output image to a new file")
@@ -59,7 +166,7 @@ class FileActionsHandler(BaseActionsHandler):
         # Export Menu
         self.exportMenu = QMenu("Export", mw)
         self.exportMenu.setIcon(
-            QIcon("icons/export_output.png")
+            cached_icon("icons/export_output.png")
         )  # Corrected icon for submenu
 
         self.exportSourceAction = QAction("Source", mw)
@@ -97,17 +204,16 @@ class FileActionsHandler(BaseActionsHandler):
     # --- Action Logic Methods ---
     def open_source(self):
         mw = self.main_window
-        options = QFileDialog.Options()
         fileName, _ = QFileDialog.getOpenFileName(
             mw,  # Parent
             "Select Source File",  # Caption
             "",  # Directory
-            "Image Files (*.jpg *.jpeg *.png *.bmp *.tif *.tiff);;All Files (*)",  # Filter - adjusted as per requirement
-            options=options,
+            self._OPEN_FILTER,  # Filter - adjusted as per requirement
+            options=self._DIALOG_OPTIONS,
         )
         if fileName:
             try:
-                image_data = imageio.v3.imread(fileName)
+                image_data = _read_image(fileName)
                 mw.sourceFilePath = fileName
                 mw.current_source_image = image_data
                 fileName = os.path.basename(fileName)
@@ -165,27 +271,12 @@ class FileActionsHandler(BaseActionsHandler):
             return
 
         # Ana dizini al (C:\Users\ipekb\Desktop\lab_oop_2)
-        current_directory = os.path.dirname(os.path.realpath(__file__))
+        current_directory = _MODULE_DIR
         
-        # Son işlem adını al
+        # History entries hold image states, not operations, so outputs get a
+        # generic suffix
         last_op_name = "processed"
-        if (
-            hasattr(mw, "edit_handler")
-            and mw.edit_handler
-            and mw.edit_handler.undo_stack
-        ):
-            last_operation = mw.edit_handler.undo_stack[-1]
-            # Tuple kontrolü ekle
-            if isinstance(last_operation, tuple):
-                last_op_name = "processed"
-            else:
-                last_op_name = (
-                    last_operation.get_operation_name()
-                    .lower()
-                    .replace(" ", "_")
-                    .replace("->", "_to_")
-                )
-        
+
         # Kaynak dosya adını ve uzantısını ayır
         file_base, file_ext = os.path.splitext(os.path.basename(mw.sourceFilePath))
         
@@ -195,8 +286,7 @@ class FileActionsHandler(BaseActionsHandler):
         # Ana dizin ile yeni dosya adını birleştir
         targetPath = os.path.join(current_directory, new_filename)
 
-        try:
-            self._save_image(mw.current_output_image, targetPath)
+        def on_saved():
             mw.outputFilePath = targetPath  # Update the known output path
             mw._logMessage(
                 f"Output saved to main directory: {targetPath}", "success"
@@ -205,10 +295,8 @@ class FileActionsHandler(BaseActionsHandler):
                 f"Output saved to {os.path.basename(targetPath)} (main directory)", 4000
             )
             mw._activateUIComponents()  # Update button states
-        except Exception as e:
-            error_msg = f"Failed to save output to {targetPath}: {e}"
-            mw._logMessage(error_msg, "error")
-            QMessageBox.critical(mw, "Save Error", error_msg)
+
+        self._save_image(mw.current_output_image, targetPath, on_saved)
 
     def save_output_as(self):
         mw = self.main_window
@@ -219,22 +307,6 @@ class FileActionsHandler(BaseActionsHandler):
         # Suggest a filename
         suggested_name = "output.png"
         last_op_name = "processed"
-        if (
-            hasattr(mw, "edit_handler")
-            and mw.edit_handler
-            and mw.edit_handler.undo_stack
-        ):
-            last_operation = mw.edit_handler.undo_stack[-1]
-            # Tuple kontrolü ekle
-            if isinstance(last_operation, tuple):
-                last_op_name = "processed"
-            else:
-                last_op_name = (
-                    last_operation.get_operation_name()
-                    .lower()
-                    .replace(" ", "_")
-                    .replace("->", "_to_")
-                )
 
         if mw.sourceFilePath:
             base, _ = os.path.splitext(os.path.basename(mw.sourceFilePath))
@@ -243,51 +315,66 @@ class FileActionsHandler(BaseActionsHandler):
         else:
             suggested_name = f"{last_op_name}.png"
 
-        options = QFileDialog.Options()
         # Ana dizini başlangıç yolu olarak kullan (C:\Users\ipekb\Desktop\lab_oop_2)
-        current_directory = os.path.dirname(os.path.realpath(__file__))
+        current_directory = _MODULE_DIR
         filePath, selected_filter = QFileDialog.getSaveFileName(
             mw,
             "Save Output As...",
             os.path.join(current_directory, suggested_name),
-            "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg);;Bitmap Image (*.bmp);;TIFF Image (*.tif *.tiff);;All Files (*)",
-            options=options,
+            self._SAVE_FILTER,
+            options=self._DIALOG_OPTIONS,
         )
 
         if filePath:
-            try:
-                self._save_image(mw.current_output_image, filePath)
+
+            def on_saved():
                 mw.outputFilePath = filePath  # Store the new path
                 mw._logMessage(f"Output saved to new file: {filePath}", "success")
                 mw.statusBar.showMessage(
                     f"Output saved to {os.path.basename(filePath)}", 4000
                 )
                 mw._activateUIComponents()  # Update save button state
-            except Exception as e:
-                error_msg = f"Failed to save output to {filePath}: {e}"
-                mw._logMessage(error_msg, "error")
-                QMessageBox.critical(mw, "Save As Error", error_msg)
+
+            self._save_image(mw.current_output_image, filePath, on_saved)
         else:
             mw._logMessage("Save As cancelled.", "info")
 
-    def _save_image(self, image_data: np.ndarray, file_path: str):
-        """Helper to save numpy array as image using imageio."""
-        try:
-            # Ensure image data is in uint8 format if it's a common type
-            if image_data.dtype != np.uint8:
-                if image_data.max() <= 1.0 and image_data.min() >= 0.0:
-                    image_data = (image_data * 255).astype(np.uint8)
-                else:
-                    # Attempt conversion, might need adjustments based on data range
-                    image_data = image_data.astype(np.uint8)
-            imageio.v3.imwrite(file_path, image_data)
-            self.main_window._logMessage(f"Image saved to {file_path}", "success")
-            return True
-        except Exception as e:
-            error_msg = f"Failed to save image to {file_path}: {e}"
+    def _save_image(
+        self,
+        image_data: np.ndarray,
+        file_path: str,
+        on_saved=None,
+        assume_uint8: bool = False,
+    ):
+        """
+        Saves a numpy array as an image using imageio on the global thread pool,
+        so encoding never blocks the GUI. Success and failure are reported on the
+        GUI thread; 'on_saved' is called there after a successful write and does
+        its own logging. 'assume_uint8' skips the dtype conversion for callers
+        that have already converted the image.
+        """
+        task = _SaveTask(image_data, file_path, assume_uint8)
+        task.signals.finished.connect(
+            lambda success, error: self._on_save_finished(
+                task, success, error, on_saved
+            )
+        )
+        # Keep the task (and its signals object) alive until it reports back
+        self._pending_saves.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_save_finished(self, task: _SaveTask, success: bool, error: str, on_saved):
+        self._pending_saves.discard(task)
+        file_path = task.file_path
+        if success:
+            if on_saved is not None:
+                on_saved()
+            else:
+                self.main_window._logMessage(f"Image saved to {file_path}", "success")
+        else:
+            error_msg = f"Failed to save image to {file_path}: {error}"
             self.main_window._logMessage(error_msg, "error")
             QMessageBox.critical(self.main_window, "Save Error", error_msg)
-            return False
 
     def _export_image(self, image_data: np.ndarray, base_path: str, image_type: str):
         """Handles the logic for exporting an image to the other format."""
@@ -332,14 +419,26 @@ class FileActionsHandler(BaseActionsHandler):
 
         if filePath:
             try:
-                export_img_ubyte = img_as_ubyte(image_data)
+                # uint8 (the usual case for opened JPG/PNG files) goes to the
+                # encoder as is
+                if image_data.dtype == np.uint8:
+                    export_img_ubyte = image_data
+                else:
+                    from skimage.util import img_as_ubyte
+
+                    export_img_ubyte = img_as_ubyte(image_data)
                 # Ensure JPEG quality setting if saving as JPG (optional)
                 # quality = 95
                 # io.imsave(filePath, export_img_ubyte, quality=quality if target_ext == ".jpg" else None)
-                self._save_image(export_img_ubyte, filePath)
-                mw._logMessage(f"{image_type} exported to: {filePath}", "success")
-                mw.statusBar.showMessage(
-                    f"{image_type} exported to {os.path.basename(filePath)}", 4000
+
+                def on_saved():
+                    mw._logMessage(f"{image_type} exported to: {filePath}", "success")
+                    mw.statusBar.showMessage(
+                        f"{image_type} exported to {os.path.basename(filePath)}", 4000
+                    )
+
+                self._save_image(
+                    export_img_ubyte, filePath, on_saved, assume_uint8=True
                 )
             except Exception as e:
                 error_msg = f"Failed to export {image_type} to {filePath}: {e}"
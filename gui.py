@@ -1,10 +1,13 @@
 import os
 import sys
+from collections import deque
+from functools import lru_cache, partial
+from types import SimpleNamespace
 from typing import Union
 
 import numpy as np
-from PyQt5.QtCore import QSize, Qt
-from PyQt5.QtGui import QFont, QIcon, QImage, QPixmap
+from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtGui import QFont, QTextCursor
 from PyQt5.QtWidgets import (
     QAbstractSpinBox,
     QAction,
@@ -38,8 +41,6 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from skimage import img_as_ubyte
-from skimage.transform import resize
 
 from conversion_operations import (
     BinaryThresholdOperation,
@@ -55,6 +56,7 @@ from edge_detection_operations import (
 )
 from edit import EditActionsHandler
 from file import FileActionsHandler
+from handler_base import cached_icon
 from segmentation_operations import (
     ChanVeseOperation,
     MorphSnakesOperation,
@@ -62,22 +64,641 @@ from segmentation_operations import (
 )
 
 # Yeni dosyalardan içe aktarıyoruz
-from worker import WorkerThread
 from progress_dialog import ProgressPopup
 from operation_handler import OperationHandler
 from image_operations import ImageOperations
 
+# Log level -> (prefix, text color)
+LOG_PREFIX_MAP = {
+    "info": "[INFO]",
+    "success": "[OK]",
+    "warning": "[WARN]",
+    "error": "[ERROR]",
+}
+LOG_COLOR_MAP = {"success": "#388E3C", "warning": "#FFA000", "error": "#B3261E"}
+LOG_FLUSH_INTERVAL_MS = 16  # Coalesce log lines into about one insert per frame
+PARAM_SETTLE_INTERVAL_MS = 120  # Quiet time before reacting to slider drags
+RESIZE_SETTLE_INTERVAL_MS = 120  # Quiet time before the smooth rescale after resizing
+
+
+def _box_layout(layout_cls, parent, widgets, margins, spacing):
+    layout = layout_cls(parent) if parent is not None else layout_cls()
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    for widget in widgets:
+        layout.addWidget(widget)
+    return layout
+
+
+def _vbox(parent=None, *widgets, margins=(0, 0, 0, 0), spacing=0):
+    """QVBoxLayout on parent (if given) with margins, spacing and widgets set."""
+    return _box_layout(QVBoxLayout, parent, widgets, margins, spacing)
+
+
+def _hbox(parent=None, *widgets, margins=(0, 0, 0, 0), spacing=0):
+    """QHBoxLayout on parent (if given) with margins, spacing and widgets set."""
+    return _box_layout(QHBoxLayout, parent, widgets, margins, spacing)
+
+
+# Material 3 color roles used by the style sheet
+M3_PALETTE = SimpleNamespace(
+    primary="#6750A4",  # Purple
+    on_primary="#FFFFFF",
+    primary_container="#EADDFF",
+    on_primary_container="#21005D",
+    secondary="#9C27B0",  # Deeper purple
+    on_secondary="#FFFFFF",
+    secondary_container="#E8DEF8",
+    on_secondary_container="#1D192B",
+    tertiary="#E91E63",  # Pink
+    on_tertiary="#FFFFFF",
+    tertiary_container="#FFD8E4",
+    on_tertiary_container="#31111D",
+    error="#B3261E",
+    on_error="#FFFFFF",
+    error_container="#F9DEDC",
+    on_error_container="#410E0B",
+    background="#FFFBFE",
+    on_background="#1C1B1F",
+    surface="#FFFBFE",
+    on_surface="#1C1B1F",
+    surface_variant="#E7E0EC",
+    on_surface_variant="#49454F",
+    outline="#79747E",
+    hover_primary="#EADDFF",
+    hover_secondary="#E8DEF8",
+    selected_primary_container="#D0BCFF",
+    disabled_bg="#E0E0E0",
+    disabled_fg="#A0A0A0",
+)
+
+
+@lru_cache(maxsize=1)
+def build_style_sheet() -> str:
+    """Renders the M3 style sheet; the palette is fixed, so this runs once."""
+    palette = M3_PALETTE
+    styleSheet = f"""
+        QMainWindow {{
+            background-color: {palette.background};
+            font-family: "Segoe UI", Arial, sans-serif;
+        }}
+        QWidget#LeftPanel {{
+            background-color: {palette.surface};
+            border-right: 1px solid {palette.outline};
+        }}
+        QMenuBar#MainMenuBar {{
+            background-color: {palette.surface};
+            border-bottom: 1px solid {palette.outline};
+            color: {palette.on_surface};
+            padding: 2px;
+        }}
+        QMenuBar#MainMenuBar::item {{
+            padding: 5px 10px;
+            background-color: transparent;
+            color: {palette.on_surface_variant};
+        }}
+        QMenuBar#MainMenuBar::item:selected {{
+            background-color: {palette.primary_container};
+            color: {palette.on_primary_container};
+        }}
+        QMenu {{
+            background-color: {palette.surface} !important;
+            border: 1px solid {palette.outline};
+            padding: 5px;
+            color: {palette.on_surface};
+        }}
+        QMenu::item {{
+            padding: 6px 20px;
+            border-radius: 3px;
+            background-color: {palette.surface} !important;
+            color: {palette.on_surface};
+        }}
+        QMenu::item:selected {{
+            background-color: {palette.primary_container} !important;
+            color: {palette.on_primary_container};
+        }}
+        QMenu::item:disabled {{
+            color: {palette.disabled_fg};
+        }}
+        QMenu::separator {{
+            height: 1px;
+            background: {palette.outline};
+            margin: 4px 0px;
+        }}
+        QToolBar#MainToolBar {{
+            background-color: {palette.surface};
+            border-bottom: 1px solid {palette.outline};
+            padding: 3px;
+            spacing: 4px;
+        }}
+        QToolButton {{
+            background-color: transparent;
+            border: 1px solid transparent;
+            padding: 5px;
+            margin: 1px;
+            border-radius: 4px;
+            color: {palette.on_surface_variant};
+        }}
+        QToolButton:hover {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+            border: 1px solid {palette.secondary_container};
+        }}
+        QToolButton:pressed {{
+            background-color: {palette.selected_primary_container};
+            color: {palette.on_primary_container};
+        }}
+        QToolButton:disabled {{
+            color: {palette.disabled_fg};
+            background-color: transparent;
+            border: 1px solid transparent;
+        }}
+        QPushButton {{
+            background-color: {palette.primary};
+            color: {palette.on_primary};
+            border: 0px;
+            padding: 8px 12px;
+            border-radius: 16px;
+            font-size: 9pt;
+            min-height: 28px;
+            text-align: center;
+            font-weight: 500;
+        }}
+        QPushButton:hover {{
+            background-color: {palette.primary_container};
+            color: {palette.on_primary_container};
+        }}
+        QPushButton:pressed {{
+            background-color: {palette.selected_primary_container};
+            color: {palette.on_primary_container};
+        }}
+        QPushButton:checked {{
+            background-color: {palette.primary};
+            color: {palette.on_primary};
+        }}
+        QPushButton:disabled {{
+            background-color: {palette.disabled_bg};
+            color: {palette.disabled_fg};
+        }}
+        QPushButton#OperationButton {{
+            background-color: {palette.secondary};
+            color: {palette.on_secondary};
+            text-align: left;
+            padding-left: 15px;
+            border-radius: 4px;
+        }}
+        QPushButton#OperationButton:hover {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+        }}
+        QPushButton#OperationButton:pressed {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+        }}
+        QPushButton#OperationButton:checked {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+            border: 1px solid {palette.secondary};
+        }}
+        QPushButton#UtilityButton {{
+            background-color: {palette.tertiary_container};
+            color: {palette.on_tertiary_container};
+            border-radius: 4px;
+        }}
+        QPushButton#UtilityButton:hover {{
+            background-color: {palette.tertiary};
+            color: {palette.on_tertiary};
+        }}
+        QPushButton#UtilityButton:pressed {{
+            background-color: {palette.tertiary};
+            color: {palette.on_tertiary};
+        }}
+        QPushButton#UtilityButton:disabled {{
+            background-color: {palette.disabled_bg};
+            color: {palette.disabled_fg};
+        }}
+        QPushButton#SpinnerButton {{
+            background-color: {palette.tertiary};
+            color: {palette.on_tertiary};
+            min-width: 24px;
+            max-width: 24px;
+            min-height: 24px;
+            max-height: 24px;
+            padding: 0px;
+            font-weight: bold;
+            font-size: 14px;
+            border-radius: 12px;
+        }}
+        QStatusBar#MainStatusBar {{
+            background-color: {palette.surface_variant};
+            border-top: 1px solid {palette.outline};
+            color: {palette.on_surface_variant};
+            padding: 3px;
+        }}
+        QLabel#PanelTitleLabel {{
+            font-weight: bold;
+            font-size: 11pt;
+            padding: 6px 4px;
+            color: {palette.primary};
+            border-bottom: 1px solid {palette.outline};
+            margin-bottom: 5px;
+        }}
+        QWidget#ImagePanel {{
+            background-color: {palette.surface};
+            border: 1px solid {palette.outline};
+            border-radius: 4px;
+        }}
+        QLabel#PixmapLabel {{
+            background-color: {palette.surface_variant};
+            border: 1px dashed {palette.outline};
+            color: {palette.on_surface_variant};
+            border-radius: 3px;
+            min-height: 200px;
+            padding: 10px;
+            font-style: normal;
+            text-align: center;
+        }}
+        QSplitter::handle {{
+            background-color: {palette.outline};
+        }}
+        QSplitter::handle:horizontal {{
+            width: 1px;
+            margin: 0px 2px;
+        }}
+        QSplitter::handle:vertical {{
+            height: 1px;
+            margin: 2px 0px;
+        }}
+        QSplitter::handle:hover {{
+            background-color: {palette.primary};
+        }}
+        QGroupBox {{ /* General GroupBox Style */
+            font-size: 9pt;
+            font-weight: normal;
+            color: {palette.on_surface_variant};
+            border: 1px solid {palette.outline};
+            border-radius: 4px;
+            margin-top: 15px; /* Space for title */
+            background-color: {palette.surface};
+            padding: 10px; /* Internal padding */
+            padding-top: 15px; /* More padding at top */
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            margin-left: 10px; /* Indent title */
+            margin-top: -1px; /* Pull title up slightly */
+            padding: 2px 5px; /* Padding around title */
+            background-color: {palette.surface}; /* Match background */
+            border-radius: 3px;
+            color: {palette.on_surface_variant};
+            font-weight: bold;
+        }}
+        QGroupBox#LogGroup {{ /* Specific Log Group Style Overrides */
+            margin-top: 20px;
+            padding: 5px;
+            padding-top: 10px;
+        }}
+        QGroupBox#LogGroup::title {{
+            margin-left: 12px;
+            margin-top: -6px;
+            padding: 4px 8px;
+            background-color: {palette.surface_variant};
+            color: {palette.on_surface_variant};
+        }}
+        QTextBrowser#LogBox {{
+            background-color: {palette.surface};
+            border: 0px;
+            color: {palette.on_surface};
+            font-family: Consolas, Courier New, monospace;
+            font-size: 9pt;
+            padding: 5px;
+        }}
+        QListWidget#CategoryList {{
+            border: 1px solid {palette.outline};
+            background-color: {palette.surface};
+            padding: 1px;      /* Minimal padding for the list widget itself */
+            border-radius: 4px;
+            outline: 0;
+        }}
+        QListWidget#CategoryList::item {{
+            padding: 4px 8px;  /* Reduced padding for items */
+            margin: 0px;       /* No margin between items */
+            border-radius: 3px;
+            color: {palette.on_surface};
+        }}
+        QListWidget#CategoryList::item:hover {{
+            background-color: {palette.hover_secondary};
+            color: {palette.on_secondary_container};
+        }}
+        QListWidget#CategoryList::item:selected {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+            font-weight: bold;
+            border-left: 3px solid {palette.secondary};
+            padding-left: 7px;
+        }}
+        QWidget#OperationsStack {{
+            background-color: {palette.surface};
+            border: 0px;
+            border-radius: 0px;
+            padding: 5px;
+        }}
+
+        /* --- Material Design 3 Slider --- */
+        QSlider::groove:horizontal {{
+            border-radius: 2px; /* Slightly rounded track ends */
+            height: 4px;        /* M3 typical track height */
+            background: {palette.surface_variant}; /* Inactive track color */
+            margin: 0px;
+        }}
+        QSlider::sub-page:horizontal {{ /* Active part of the track */
+            background: {palette.primary};
+            border-radius: 2px;
+            height: 4px;
+        }}
+        QSlider::add-page:horizontal {{ /* Inactive part of the track */
+            background: {palette.surface_variant};
+            border-radius: 2px;
+            height: 4px;
+        }}
+        QSlider::handle:horizontal {{
+            background: {palette.primary}; /* Handle color */
+            border: 2px solid {palette.surface}; /* Border to make it pop from the track */
+            width: 20px;   /* M3 standard handle size */
+            height: 20px;
+            margin: -8px 0; /* Vertically center 20px handle on 4px track */
+            border-radius: 10px; /* Circular handle */
+        }}
+        QSlider::handle:horizontal:hover {{
+            background: {palette.primary_container}; /* Lighter primary for hover */
+            border: 2px solid {palette.primary_container};
+        }}
+        QSlider::handle:horizontal:pressed {{
+            background: {palette.selected_primary_container}; /* More prominent for pressed */
+            border: 2px solid {palette.selected_primary_container};
+        }}
+        /* --- End Material Design 3 Slider --- */
+
+        QSpinBox, QDoubleSpinBox {{
+            padding: 6px 8px;
+            border: 1px solid {palette.outline};
+            border-radius: 12px;
+            background-color: {palette.surface};
+            color: {palette.on_surface};
+            min-width: 70px;
+            font-weight: 500;
+            selection-background-color: {palette.primary_container};
+        }}
+        QSpinBox:hover, QDoubleSpinBox:hover {{
+            border: 1px solid {palette.primary};
+            background-color: {palette.surface_variant};
+        }}
+        QSpinBox:focus, QDoubleSpinBox:focus {{
+            border: 2px solid {palette.primary};
+            padding: 5px 7px;
+        }}
+        QSpinBox::up-button, QDoubleSpinBox::up-button {{
+            subcontrol-origin: border;
+            subcontrol-position: top right;
+            width: 24px;
+            height: 12px;
+            border: 0px;
+            border-top-right-radius: 8px;
+            background-color: {palette.surface_variant};
+        }}
+        QSpinBox::down-button, QDoubleSpinBox::down-button {{
+            subcontrol-origin: border;
+            subcontrol-position: bottom right;
+            width: 24px;
+            height: 12px;
+            border: 0px;
+            border-bottom-right-radius: 8px;
+            background-color: {palette.surface_variant};
+        }}
+        QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
+        QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
+            background-color: {palette.primary_container};
+        }}
+        QSpinBox::up-button:pressed, QDoubleSpinBox::up-button:pressed,
+        QSpinBox::down-button:pressed, QDoubleSpinBox::down-button:pressed {{
+            background-color: {palette.primary};
+        }}
+        QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
+            width: 12px;
+            height: 6px;
+            background: {palette.on_surface_variant};
+        }}
+        QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
+            width: 12px;
+            height: 6px;
+            background: {palette.on_surface_variant};
+        }}
+        QSpinBox::up-arrow:hover, QDoubleSpinBox::up-arrow:hover,
+        QSpinBox::down-arrow:hover, QDoubleSpinBox::down-arrow:hover {{
+            background: {palette.on_primary_container};
+        }}
+        
+        /* --- Material Design 3 Binary Threshold Components --- */
+        QDoubleSpinBox#MaterialValueDisplay {{
+            background-color: transparent;
+            border: none;
+            font-size: 16px;
+            font-weight: 500;
+            color: {palette.on_primary_container};
+            padding: 4px;
+            text-align: center;
+        }}
+        
+        QWidget#ThresholdWidget {{
+            background-color: {palette.surface};
+            border-radius: 8px;
+            padding: 8px;
+        }}
+        
+        QLabel#ParameterLabel {{
+            font-size: 14px;
+            font-weight: 500;
+            color: {palette.on_surface_variant};
+            margin-bottom: 4px;
+        }}
+        
+        QLabel#InfoLabel {{
+            color: gray;
+            font-style: italic;
+            font-size: 8pt;
+        }}
+        
+        QLabel#DialogInfoLabel {{
+            color: gray;
+            font-style: italic;
+        }}
+        
+        QPushButton#CircleButton {{
+            background-color: {palette.tertiary};
+            color: {palette.on_tertiary};
+            border-radius: 18px;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 0px;
+        }}
+        
+        QPushButton#CircleButton:hover {{
+            background-color: {palette.secondary_container};
+            color: {palette.on_secondary_container};
+        }}
+        
+        QPushButton#CircleButton:pressed {{
+            background-color: {palette.secondary};
+            color: {palette.on_secondary};
+        }}
+        
+        QSlider#ThresholdSlider::groove:horizontal {{
+            border-radius: 3px;
+            height: 6px;
+            background: {palette.surface_variant};
+        }}
+        
+        QSlider#ThresholdSlider::sub-page:horizontal {{
+            background: {palette.primary};
+            border-radius: 3px;
+            height: 6px;
+        }}
+        
+        QSlider#ThresholdSlider::add-page:horizontal {{
+            background: {palette.surface_variant};
+            border-radius: 3px;
+            height: 6px;
+        }}
+        
+        QSlider#ThresholdSlider::handle:horizontal {{
+            background: {palette.secondary};
+            border: 2px solid {palette.surface};
+            width: 26px;
+            height: 26px;
+            margin: -10px 0;
+            border-radius: 13px;
+        }}
+        
+        QSlider#ThresholdSlider::handle:horizontal:hover {{
+            background: {palette.primary_container};
+            border: 2px solid {palette.primary};
+        }}
+        
+        QSlider#ThresholdSlider::handle:horizontal:pressed {{
+            background: {palette.selected_primary_container};
+            border: 2px solid {palette.primary};
+        }}
+        
+        QWidget#MaterialCardContainer {{
+            background-color: {palette.surface};
+            border-radius: 12px;
+            border: 1px solid {palette.outline};
+        }}
+        
+        QCheckBox#MaterialCheckbox {{
+            font-size: 14px;
+            color: {palette.on_surface_variant};
+            spacing: 8px;
+            margin-top: 8px;
+        }}
+        
+        QCheckBox#MaterialCheckbox::indicator {{
+            width: 20px;
+            height: 20px;
+            border: 2px solid {palette.outline};
+            border-radius: 2px;
+        }}
+        
+        QCheckBox#MaterialCheckbox::indicator:checked {{
+            background-color: {palette.primary};
+            border: 2px solid {palette.primary};
+        }}
+        
+        QCheckBox#MaterialCheckbox::indicator:hover {{
+            border: 2px solid {palette.primary};
+        }}
+        /* --- End Material Design 3 Binary Threshold Components --- */
+        
+        QCheckBox {{
+            spacing: 5px;
+            color: {palette.on_surface};
+        }}
+        QCheckBox::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 1px solid {palette.outline};
+            border-radius: 3px;
+            background-color: {palette.surface};
+        }}
+        QCheckBox::indicator:checked {{
+            background-color: {palette.primary};
+            border: 1px solid {palette.primary};
+        }}
+        QCheckBox::indicator:hover {{
+            border: 1px solid {palette.primary};
+        }}
+        QCheckBox:disabled {{
+            color: {palette.disabled_fg};
+        }}
+        QCheckBox::indicator:disabled {{
+            background-color: {palette.disabled_bg};
+            border: 1px solid {palette.disabled_fg};
+        }}
+        QFormLayout {{
+            horizontal-spacing: 10px;
+            vertical-spacing: 8px;
+        }}
+        QLabel {{
+            color: {palette.on_surface};
+            padding-top: 4px;
+        }}
+    """
+    return styleSheet
+
 
 class MainWindow(QMainWindow):
     """Main application window for Image Processing and Lane Tracking."""
 
+    # Shared widget metrics (QSize is a plain value type, safe before QApplication)
+    TOOLBAR_ICON_SIZE = QSize(30, 30)
+    CIRCLE_BUTTON_SIZE = QSize(36, 36)
+    CATEGORY_ITEM_HEIGHT = 30
+
+    # Initial value of each parameter spin box, also used while its page is unbuilt
+    PARAM_DEFAULTS = {
+        "otsuClassesSpinBox": 3,
+        "chanveseIterSpinBox": 200,
+        "chanveseTolSpinBox": 0.001,
+        "morphIterSpinBox": 50,
+        "morphSmoothSpinBox": 3,
+        "edgeThresholdSpinBox": 0.1,
+        "edgeSigmaSpinBox": 0.0,
+    }
+
     def __init__(self):
         """Initializes the main window and its UI components."""
         super().__init__()
         self.setWindowTitle("Image Processing Lab")
+
+        # Pending log lines, written to the log box in batches by _flushLog
+        self._logQueue = deque()
+        self._logFlushScheduled = False
+
+        # Parameter changes are reported once the controls settle
+        self._edgeParamsTimer = QTimer(self)
+        self._edgeParamsTimer.setSingleShot(True)
+        self._edgeParamsTimer.setInterval(PARAM_SETTLE_INTERVAL_MS)
+        self._edgeParamsTimer.timeout.connect(self._showEdgeParams)
+
+        # Resizes show a fast rescale at once and a smooth one when they settle
+        self._smoothRescaleTimer = QTimer(self)
+        self._smoothRescaleTimer.setSingleShot(True)
+        self._smoothRescaleTimer.setInterval(RESIZE_SETTLE_INTERVAL_MS)
+        self._smoothRescaleTimer.timeout.connect(self._finalizeSmoothRescale)
         
         # Uygulama ikonunu ayarlama
-        app_icon = QIcon("icons/app.png")
+        app_icon = cached_icon("icons/app.png")
         self.setWindowIcon(app_icon)
         
         # Windows görev çubuğu için özel TaskBar Icon ayarı
@@ -89,7 +710,6 @@ class MainWindow(QMainWindow):
             self._logMessage(f"Windows taskbar icon ayarlanamadı: {str(e)}", "warning")
         
         self.resize(1280, 800)
-        self.worker_thread = None
         self.progress_popup = None
 
         # Image state
@@ -104,7 +724,6 @@ class MainWindow(QMainWindow):
         
         # UI components
         self.progress_popup = ProgressPopup(self)
-        self.worker_thread = None
 
         self.logBox = None
         self.sourcePixmapLabel = None
@@ -133,6 +752,9 @@ class MainWindow(QMainWindow):
         self.scharrButton = None
         self.prewittButton = None
         self.applyBinaryThresholdButton = None
+        # Operation buttons of the pages built so far, for bulk enable/disable
+        self._operationButtons = []
+        self._actionsConnected = False
 
         self.fileMenu = None
         self.editMenu = None
@@ -148,33 +770,61 @@ class MainWindow(QMainWindow):
         self.edit_handler = EditActionsHandler(self)
         self.file_handler = FileActionsHandler(self)
 
+        # Show the bare window right away; the rest of the UI is built in
+        # phases from the event loop, so a frame is painted between them
+        self._createStatusBar()
+        self.show()
+        QTimer.singleShot(0, self._buildMenusAndToolBars)
+
+    def _buildMenusAndToolBars(self):
+        """Startup phase 2: menu bar and toolbar."""
         self._createMenuBar()
         self._createToolBars()
-        self._createCentralWidget()
-        self._createStatusBar()
+        QTimer.singleShot(0, self._buildCentralWidget)
+
+    def _buildCentralWidget(self):
+        """Startup phase 3: styles, then the central widget."""
+        # Styles go first so the central widgets are polished once, when created
         self._applyStyles()
+        self._createCentralWidget()
+        # Messages logged before the log box existed are still queued
+        self._flushLog()
+        QTimer.singleShot(0, self._finishStartup)
+
+    def _finishStartup(self):
+        """Startup phase 4: signal wiring and initial UI state."""
         self._connectActions()
         self._setInitialState()
-
         self._logMessage("Application started. Ready.")
-        self.show()
 
     def _logMessage(self, message, level="info"):
-        """Appends a message to the log box with level indication."""
-        prefix_map = {
-            "info": "[INFO]",
-            "success": "[OK]",
-            "warning": "[WARN]",
-            "error": "[ERROR]",
-        }
-        prefix = prefix_map.get(level.lower(), "[INFO]")
-        if self.logBox:
-            color_map = {"success": "#388E3C", "warning": "#FFA000", "error": "#B3261E"}
-            text_color = color_map.get(level.lower(), "#1C1B1F")
-            log_entry = f'<span style="color:{text_color};white-space:pre">{prefix} {message}</span><br>'
-            self.logBox.insertHtml(log_entry)
-            self.logBox.moveCursor(self.logBox.textCursor().End)
-            QApplication.processEvents()
+        """
+        Queues a message for the log box with level indication. Messages are
+        written in batches from the event loop (see _flushLog), so logging never
+        re-enters the event loop or touches the document once per line.
+        """
+        self._logQueue.append((level.lower(), message))
+        if not self._logFlushScheduled:
+            self._logFlushScheduled = True
+            QTimer.singleShot(LOG_FLUSH_INTERVAL_MS, self._flushLog)
+
+    def _flushLog(self):
+        """Writes all queued log messages to the log box with a single insert."""
+        self._logFlushScheduled = False
+        if self.logBox is None:
+            return  # Keep the queue; _buildCentralWidget flushes once the box exists
+        entries = []
+        while self._logQueue:
+            level, message = self._logQueue.popleft()
+            prefix = LOG_PREFIX_MAP.get(level, "[INFO]")
+            text_color = LOG_COLOR_MAP.get(level, "#1C1B1F")
+            entries.append(
+                f'<span style="color:{text_color};white-space:pre">{prefix} {message}</span><br>'
+            )
+        if entries:
+            self.logBox.moveCursor(QTextCursor.End)
+            self.logBox.insertHtml("".join(entries))
+            self.logBox.moveCursor(QTextCursor.End)
 
     def _createMenuBar(self):
         """Creates the main menu bar and its menus/actions."""
@@ -230,32 +880,32 @@ class MainWindow(QMainWindow):
         """Creates the toolbars for common actions."""
         self.fileToolBar = self.addToolBar("File/Edit")
         self.fileToolBar.setObjectName("MainToolBar")
-        self.fileToolBar.setIconSize(QSize(30, 30))
+        self.fileToolBar.setIconSize(self.TOOLBAR_ICON_SIZE)
 
         # --- File Buttons ---
         self.openSourceButton = QToolButton(self)
-        self.openSourceButton.setIcon(QIcon("icons/folder.png"))
+        self.openSourceButton.setIcon(cached_icon("icons/folder.png"))
         self.openSourceButton.setToolTip("Open Source Image (Ctrl+O)")
         self.fileToolBar.addWidget(self.openSourceButton)
 
         self.saveOutputButton = QToolButton(self)
-        self.saveOutputButton.setIcon(QIcon("icons/save_output.png"))
+        self.saveOutputButton.setIcon(cached_icon("icons/save_output.png"))
         self.saveOutputButton.setToolTip("Save Output (Ctrl+S)")
         self.fileToolBar.addWidget(self.saveOutputButton)
 
         self.saveAsOutputButton = QToolButton(self)
-        self.saveAsOutputButton.setIcon(QIcon("icons/save_as.png"))
+        self.saveAsOutputButton.setIcon(cached_icon("icons/save_as.png"))
         self.saveAsOutputButton.setToolTip("Save Output As... (Ctrl+Shift+S)")
         self.fileToolBar.addWidget(self.saveAsOutputButton)
 
         self.exportSourceButton = QToolButton(self)
-        self.exportSourceButton.setIcon(QIcon("icons/export_source.png"))
+        self.exportSourceButton.setIcon(cached_icon("icons/export_source.png"))
         self.exportSourceButton.setText("Exp Src")
         self.exportSourceButton.setToolTip("Export Source Image (.jpg <-> .png)")
         self.fileToolBar.addWidget(self.exportSourceButton)
 
         self.exportOutputButton = QToolButton(self)
-        self.exportOutputButton.setIcon(QIcon("icons/export_output.png"))
+        self.exportOutputButton.setIcon(cached_icon("icons/export_output.png"))
         self.exportOutputButton.setText("Exp Out")
         self.exportOutputButton.setToolTip("Export Output Image (.jpg <-> .png)")
         self.fileToolBar.addWidget(self.exportOutputButton)
@@ -264,12 +914,12 @@ class MainWindow(QMainWindow):
 
         # --- Edit Buttons ---
         self.undoButton = QToolButton(self)
-        self.undoButton.setIcon(QIcon("icons/undo.png"))
+        self.undoButton.setIcon(cached_icon("icons/undo.png"))
         self.undoButton.setToolTip("Undo (Ctrl+Z)")
         self.fileToolBar.addWidget(self.undoButton)
 
         self.redoButton = QToolButton(self)
-        self.redoButton.setIcon(QIcon("icons/redo.png"))
+        self.redoButton.setIcon(cached_icon("icons/redo.png"))
         self.redoButton.setToolTip("Redo (Ctrl+Y)")
         self.fileToolBar.addWidget(self.redoButton)
 
@@ -277,12 +927,12 @@ class MainWindow(QMainWindow):
 
         # --- Clear Buttons ---
         self.clearSourceButton = QToolButton(self)
-        self.clearSourceButton.setIcon(QIcon("icons/clean.png"))
+        self.clearSourceButton.setIcon(cached_icon("icons/clean.png"))
         self.clearSourceButton.setToolTip("Clear Source Image")
         self.fileToolBar.addWidget(self.clearSourceButton)
 
         self.clearOutputButton = QToolButton(self)
-        self.clearOutputButton.setIcon(QIcon("icons/clean.png"))
+        self.clearOutputButton.setIcon(cached_icon("icons/clean.png"))
         self.clearOutputButton.setToolTip("Clear Output Image")
         self.fileToolBar.addWidget(self.clearOutputButton)
 
@@ -314,23 +964,23 @@ class MainWindow(QMainWindow):
         self.categoryList.setFont(listFont)
 
         # Conversion Item
-        conversion_item = QListWidgetItem(QIcon("icons/conversion.png"), "Conversion")
+        conversion_item = QListWidgetItem(cached_icon("icons/conversion.png"), "Conversion")
         conversion_item.setToolTip("Image format and color space conversions.")
-        conversion_item.setSizeHint(QSize(conversion_item.sizeHint().width(), 30)) # Set fixed height
+        conversion_item.setSizeHint(QSize(conversion_item.sizeHint().width(), self.CATEGORY_ITEM_HEIGHT)) # Set fixed height
         self.categoryList.addItem(conversion_item)
 
         # Segmentation Item
         segmentation_item = QListWidgetItem(
-            QIcon("icons/segmentation.png"), "Segmentation"
+            cached_icon("icons/segmentation.png"), "Segmentation"
         )
         segmentation_item.setToolTip("Image segmentation algorithms.")
-        segmentation_item.setSizeHint(QSize(segmentation_item.sizeHint().width(), 30)) # Set fixed height
+        segmentation_item.setSizeHint(QSize(segmentation_item.sizeHint().width(), self.CATEGORY_ITEM_HEIGHT)) # Set fixed height
         self.categoryList.addItem(segmentation_item)
 
         # Edge Detection Item
-        edge_item = QListWidgetItem(QIcon("icons/edge_detection.png"), "Edge Detection")
+        edge_item = QListWidgetItem(cached_icon("icons/edge_detection.png"), "Edge Detection")
         edge_item.setToolTip("Edge detection filters.")
-        edge_item.setSizeHint(QSize(edge_item.sizeHint().width(), 30)) # Set fixed height
+        edge_item.setSizeHint(QSize(edge_item.sizeHint().width(), self.CATEGORY_ITEM_HEIGHT)) # Set fixed height
         self.categoryList.addItem(edge_item)
 
         leftLayout.addWidget(self.categoryList)
@@ -377,7 +1027,7 @@ class MainWindow(QMainWindow):
         # Sadece Clear Source butonu kalıyor, undo/redo butonları kaldırıldı
         self.clearSourcePanelButton = QPushButton("Clear Source")
         self.clearSourcePanelButton.setObjectName("UtilityButton")
-        self.clearSourcePanelButton.setIcon(QIcon("icons/clean.png"))
+        self.clearSourcePanelButton.setIcon(cached_icon("icons/clean.png"))
         sourceButtonsLayout.addWidget(self.clearSourcePanelButton)
         
         # Buton düzenini ana Source paneli düzenine ekliyoruz
@@ -405,21 +1055,21 @@ class MainWindow(QMainWindow):
         # Undo butonu
         self.outputUndoButton = QPushButton("Undo")
         self.outputUndoButton.setObjectName("UtilityButton")
-        self.outputUndoButton.setIcon(QIcon("icons/undo.png"))
+        self.outputUndoButton.setIcon(cached_icon("icons/undo.png"))
         self.outputUndoButton.setToolTip("Undo last operation")
         outputButtonsLayout.addWidget(self.outputUndoButton)
         
         # Redo butonu
         self.outputRedoButton = QPushButton("Redo")
         self.outputRedoButton.setObjectName("UtilityButton")
-        self.outputRedoButton.setIcon(QIcon("icons/redo.png"))
+        self.outputRedoButton.setIcon(cached_icon("icons/redo.png"))
         self.outputRedoButton.setToolTip("Redo last undone operation")
         outputButtonsLayout.addWidget(self.outputRedoButton)
         
         # Clear Output butonu (mevcut butonu yeni düzene taşıyoruz)
         self.clearOutputPanelButton = QPushButton("Clear Output")
         self.clearOutputPanelButton.setObjectName("UtilityButton")
-        self.clearOutputPanelButton.setIcon(QIcon("icons/clean.png"))
+        self.clearOutputPanelButton.setIcon(cached_icon("icons/clean.png"))
         outputButtonsLayout.addWidget(self.clearOutputPanelButton)
         
         # Buton düzenini ana Output paneli düzenine ekliyoruz
@@ -492,14 +1142,14 @@ class MainWindow(QMainWindow):
             conversion_layout.setSpacing(8)
 
             self.rgbToGrayButton = QPushButton(
-                QIcon("icons/conversion.png"), "RGB -> Grayscale"
+                cached_icon("icons/conversion.png"), "RGB -> Grayscale"
             )  # Added Icon
             self.rgbToGrayButton.setObjectName("OperationButton")
             self.rgbToGrayButton.setToolTip("Convert the current image to grayscale.")
             conversion_layout.addWidget(self.rgbToGrayButton)
 
             self.rgbToHsvButton = QPushButton(
-                QIcon("icons/conversion.png"), "RGB -> HSV"
+                cached_icon("icons/conversion.png"), "RGB -> HSV"
             )  # Added Icon
             self.rgbToHsvButton.setObjectName("OperationButton")
             self.rgbToHsvButton.setToolTip(
@@ -535,7 +1185,7 @@ class MainWindow(QMainWindow):
             # Minus button
             minus_btn = QPushButton("-")
             minus_btn.setObjectName("CircleButton")
-            minus_btn.setFixedSize(36, 36)
+            minus_btn.setFixedSize(self.CIRCLE_BUTTON_SIZE)
             minus_btn.setToolTip("Decrease threshold value")
             slider_value_layout.addWidget(minus_btn)
 
@@ -547,6 +1197,7 @@ class MainWindow(QMainWindow):
 
             # Value display
             self.binaryThresholdSpinBox = QDoubleSpinBox()
+            self.binaryThresholdSpinBox.setKeyboardTracking(False)
             self.binaryThresholdSpinBox.setRange(0.0, 1.0)
             self.binaryThresholdSpinBox.setValue(0.5)
             self.binaryThresholdSpinBox.setSingleStep(0.01)
@@ -556,11 +1207,18 @@ class MainWindow(QMainWindow):
             self.binaryThresholdSpinBox.setObjectName("MaterialValueDisplay")
             value_slider_layout.addWidget(self.binaryThresholdSpinBox)
 
-            # Slider
+            # Slider, kept in sync with the value display
             self.binaryThresholdSlider = QSlider(Qt.Horizontal)
-            self.binaryThresholdSlider.setRange(0, 100)
-            self.binaryThresholdSlider.setValue(50)
             self.binaryThresholdSlider.setObjectName("ThresholdSlider")
+            self._wire_slider_spinbox(
+                self.binaryThresholdSlider,
+                self.binaryThresholdSpinBox,
+                True,
+                0.0,
+                1.0,
+                0.5,
+                100,
+            )
             value_slider_layout.addWidget(self.binaryThresholdSlider)
 
             slider_value_layout.addWidget(value_slider_widget, 1)
@@ -568,19 +1226,15 @@ class MainWindow(QMainWindow):
             # Plus button
             plus_btn = QPushButton("+")
             plus_btn.setObjectName("CircleButton")
-            plus_btn.setFixedSize(36, 36)
+            plus_btn.setFixedSize(self.CIRCLE_BUTTON_SIZE)
             plus_btn.setToolTip("Increase threshold value")
             slider_value_layout.addWidget(plus_btn)
 
             threshold_layout.addLayout(slider_value_layout)
 
             # Connect the buttons to threshold adjustment
-            minus_btn.clicked.connect(
-                lambda: self._decrementSpinnerValue(self.binaryThresholdSpinBox, 0.01)
-            )
-            plus_btn.clicked.connect(
-                lambda: self._incrementSpinnerValue(self.binaryThresholdSpinBox, 0.01)
-            )
+            minus_btn.clicked.connect(self.binaryThresholdSpinBox.stepDown)
+            plus_btn.clicked.connect(self.binaryThresholdSpinBox.stepUp)
 
             # Add the threshold widget to the group layout
             thresholdLayout.addWidget(threshold_widget)
@@ -603,8 +1257,6 @@ class MainWindow(QMainWindow):
             conversion_layout.addWidget(self.applyBinaryThresholdButton)
             conversion_layout.addStretch()
 
-        conversionPageContainer = create_scrollable_page(fill_conversion_page)
-        self.operationsStack.addWidget(conversionPageContainer)
 
         # --- Segmentation Page ---
         def fill_segmentation_page(parent_widget):
@@ -617,7 +1269,7 @@ class MainWindow(QMainWindow):
                 label_text="Number of Classes:",
                 min_val=2,
                 max_val=10,
-                default_val=3,
+                default_val=self.PARAM_DEFAULTS["otsuClassesSpinBox"],
                 step_val=1,
                 is_float=False,
                 target_spinbox_attr="otsuClassesSpinBox",
@@ -626,7 +1278,7 @@ class MainWindow(QMainWindow):
             segmentation_layout.addWidget(otsu_classes_widget)
 
             self.multiOtsuButton = QPushButton(
-                QIcon("icons/segmentation.png"), "Apply Multi-Otsu"
+                cached_icon("icons/segmentation.png"), "Apply Multi-Otsu"
             )  # Added Icon
             self.multiOtsuButton.setObjectName("OperationButton")
             self.multiOtsuButton.setToolTip(
@@ -639,7 +1291,7 @@ class MainWindow(QMainWindow):
                 label_text="Max Iterations:",
                 min_val=50,
                 max_val=1000,
-                default_val=200,
+                default_val=self.PARAM_DEFAULTS["chanveseIterSpinBox"],
                 step_val=50,
                 is_float=False,
                 target_spinbox_attr="chanveseIterSpinBox",
@@ -651,7 +1303,7 @@ class MainWindow(QMainWindow):
                 label_text="Tolerance:",
                 min_val=0.0001,
                 max_val=0.01,
-                default_val=0.001,
+                default_val=self.PARAM_DEFAULTS["chanveseTolSpinBox"],
                 step_val=0.0001,
                 is_float=True,
                 decimals=4,
@@ -661,7 +1313,7 @@ class MainWindow(QMainWindow):
             segmentation_layout.addWidget(chanvese_tol_widget)
 
             self.chanVeseButton = QPushButton(
-                QIcon("icons/segmentation.png"), "Apply Chan-Vese"
+                cached_icon("icons/segmentation.png"), "Apply Chan-Vese"
             )  # Added Icon
             self.chanVeseButton.setObjectName("OperationButton")
             self.chanVeseButton.setToolTip(
@@ -674,7 +1326,7 @@ class MainWindow(QMainWindow):
                 label_text="Iterations:",
                 min_val=10,
                 max_val=300,
-                default_val=50,
+                default_val=self.PARAM_DEFAULTS["morphIterSpinBox"],
                 step_val=10,
                 is_float=False,
                 target_spinbox_attr="morphIterSpinBox",
@@ -686,7 +1338,7 @@ class MainWindow(QMainWindow):
                 label_text="Smoothing:",
                 min_val=1,
                 max_val=15,
-                default_val=3,
+                default_val=self.PARAM_DEFAULTS["morphSmoothSpinBox"],
                 step_val=1,
                 is_float=False,
                 target_spinbox_attr="morphSmoothSpinBox",
@@ -695,7 +1347,7 @@ class MainWindow(QMainWindow):
             segmentation_layout.addWidget(morph_smooth_widget)
 
             self.morphSnakesButton = QPushButton(
-                QIcon("icons/segmentation.png"), "Apply Morph Snakes"
+                cached_icon("icons/segmentation.png"), "Apply Morph Snakes"
             )  # Added Icon
             self.morphSnakesButton.setObjectName("OperationButton")
             self.morphSnakesButton.setToolTip(
@@ -704,8 +1356,6 @@ class MainWindow(QMainWindow):
             segmentation_layout.addWidget(self.morphSnakesButton)
             segmentation_layout.addStretch()
 
-        segmentationPageContainer = create_scrollable_page(fill_segmentation_page)
-        self.operationsStack.addWidget(segmentationPageContainer)
 
         # --- Edge Detection Page ---
         def fill_edge_page(parent_widget):
@@ -718,7 +1368,7 @@ class MainWindow(QMainWindow):
                 label_text="Threshold:",
                 min_val=0.0,
                 max_val=1.0,
-                default_val=0.1,
+                default_val=self.PARAM_DEFAULTS["edgeThresholdSpinBox"],
                 step_val=0.01,
                 is_float=True,
                 decimals=2,
@@ -732,7 +1382,7 @@ class MainWindow(QMainWindow):
                 label_text="Sigma (Blur):",
                 min_val=0.0,
                 max_val=5.0,
-                default_val=0.0,
+                default_val=self.PARAM_DEFAULTS["edgeSigmaSpinBox"],
                 step_val=0.1,
                 is_float=True,
                 decimals=1,
@@ -751,7 +1401,7 @@ class MainWindow(QMainWindow):
             )
             sigma_info = QLabel("Sigma: Gaussian blur strength (0.0 = no blur)")
             for info in [threshold_info, sigma_info]:
-                info.setStyleSheet("color: gray; font-style: italic; font-size: 8pt;")
+                info.setObjectName("InfoLabel")
                 info_layout.addWidget(info)
             edgeLayout.addWidget(info_widget)
 
@@ -759,7 +1409,7 @@ class MainWindow(QMainWindow):
             edgeMethodGroup = QGroupBox("Select Edge Detection Method")
             edgeMethodLayout = QVBoxLayout()
             self.robertsButton = QPushButton(
-                QIcon("icons/edge_detection.png"), "Roberts"
+                cached_icon("icons/edge_detection.png"), "Roberts"
             )  # Added Icon
             self.robertsButton.setObjectName("OperationButton")
             self.robertsButton.setToolTip(
@@ -767,7 +1417,7 @@ class MainWindow(QMainWindow):
             )
             edgeMethodLayout.addWidget(self.robertsButton)
             self.sobelButton = QPushButton(
-                QIcon("icons/edge_detection.png"), "Sobel"
+                cached_icon("icons/edge_detection.png"), "Sobel"
             )  # Added Icon
             self.sobelButton.setObjectName("OperationButton")
             self.sobelButton.setToolTip(
@@ -775,7 +1425,7 @@ class MainWindow(QMainWindow):
             )
             edgeMethodLayout.addWidget(self.sobelButton)
             self.scharrButton = QPushButton(
-                QIcon("icons/edge_detection.png"), "Scharr"
+                cached_icon("icons/edge_detection.png"), "Scharr"
             )  # Added Icon
             self.scharrButton.setObjectName("OperationButton")
             self.scharrButton.setToolTip(
@@ -783,7 +1433,7 @@ class MainWindow(QMainWindow):
             )
             edgeMethodLayout.addWidget(self.scharrButton)
             self.prewittButton = QPushButton(
-                QIcon("icons/edge_detection.png"), "Prewitt"
+                cached_icon("icons/edge_detection.png"), "Prewitt"
             )  # Added Icon
             self.prewittButton.setObjectName("OperationButton")
             self.prewittButton.setToolTip(
@@ -794,27 +1444,101 @@ class MainWindow(QMainWindow):
             edgeLayout.addWidget(edgeMethodGroup)
             edgeLayout.addStretch()
 
-        edgePageContainer = create_scrollable_page(fill_edge_page)
-        self.operationsStack.addWidget(edgePageContainer)
 
-    # Helper methods for value adjustment buttons
-    def _incrementSpinnerValue(self, spinner, step_value):
-        """Increments the spinner value by the given step."""
-        if isinstance(spinner, QDoubleSpinBox):
-            new_value = min(spinner.value() + step_value, spinner.maximum())
-            spinner.setValue(new_value)
-        else:  # QSpinBox
-            new_value = min(spinner.value() + step_value, spinner.maximum())
-            spinner.setValue(new_value)
-
-    def _decrementSpinnerValue(self, spinner, step_value):
-        """Decrements the spinner value by the given step."""
-        if isinstance(spinner, QDoubleSpinBox):
-            new_value = max(spinner.value() - step_value, spinner.minimum())
-            spinner.setValue(new_value)
+        # Pages are built on first visit (see _showOperationPage); until then
+        # the stack holds empty placeholders in category order
+        self._pageBuilders = [
+            lambda: create_scrollable_page(fill_conversion_page),
+            lambda: create_scrollable_page(fill_segmentation_page),
+            lambda: create_scrollable_page(fill_edge_page),
+        ]
+        self._pageConnectors = [
+            self._connectConversionPage,
+            self._connectSegmentationPage,
+            self._connectEdgePage,
+        ]
+        self._pageBuilt = [False] * len(self._pageBuilders)
+        for _ in self._pageBuilders:
+            self.operationsStack.addWidget(QWidget())
+
+    def _showOperationPage(self, index):
+        """Shows an operations page, building and wiring it on first use."""
+        if 0 <= index < len(self._pageBuilders) and not self._pageBuilt[index]:
+            placeholder = self.operationsStack.widget(index)
+            self.operationsStack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.operationsStack.insertWidget(index, self._pageBuilders[index]())
+            self._pageConnectors[index]()
+            self._pageBuilt[index] = True
+        self.operationsStack.setCurrentIndex(index)
+
+    @staticmethod
+    def _setValueSilently(widget, value):
+        """Echoes a value into a paired slider/spinbox without re-emitting valueChanged."""
+        widget.blockSignals(True)
+        widget.setValue(value)
+        widget.blockSignals(False)
+
+    def _syncSpinBoxFromSlider(self, spin_box, multiplier, value):
+        """Mirrors an integer slider position into its float spin box."""
+        self._setValueSilently(spin_box, value / multiplier)
+
+    def _syncSliderFromSpinBox(self, slider, multiplier, min_pos, max_pos, value):
+        """Mirrors a float spin box value onto its slider, clamped to the slider range."""
+        self._setValueSilently(
+            slider, max(min_pos, min(max_pos, int(round(value * multiplier))))
+        )
+
+    @staticmethod
+    def _make_spinbox(is_float, min_val, max_val, default_val, step_val, decimals):
+        """Creates the value spin box shared by both value adjuster factories."""
+        spin_box = QDoubleSpinBox() if is_float else QSpinBox()
+        # Emit valueChanged on Enter/focus-out, not on every typed digit
+        spin_box.setKeyboardTracking(False)
+        if is_float:
+            # Before range/value, which QDoubleSpinBox rounds to the current decimals
+            spin_box.setDecimals(decimals)
+            spin_box.setSingleStep(step_val)
         else:  # QSpinBox
-            new_value = max(spinner.value() - step_value, spinner.minimum())
-            spinner.setValue(new_value)
+            spin_box.setSingleStep(int(step_val))
+        spin_box.setRange(min_val, max_val)
+        spin_box.setValue(default_val)
+        return spin_box
+
+    def _wire_slider_spinbox(
+        self, slider, spin_box, is_float, min_val, max_val, default_val, slider_multiplier
+    ):
+        """Sets the slider range/value from the spin box's and keeps the two in sync."""
+        # Both widgets live on the GUI thread; skip AutoConnection's per-emit check
+        direct = Qt.DirectConnection
+        actual_min_val = min_val
+        actual_max_val = max_val
+        if min_val > max_val:  # Ensure min_val <= max_val for slider range logic
+            actual_min_val, actual_max_val = max_val, min_val
+
+        if is_float:
+            min_s_val = int(round(actual_min_val * slider_multiplier))
+            max_s_val = int(round(actual_max_val * slider_multiplier))
+            slider.setRange(min_s_val, max_s_val)
+            slider.setValue(int(round(default_val * slider_multiplier)))
+            slider.valueChanged.connect(
+                partial(self._syncSpinBoxFromSlider, spin_box, slider_multiplier), direct
+            )
+            spin_box.valueChanged.connect(
+                partial(
+                    self._syncSliderFromSpinBox,
+                    slider,
+                    slider_multiplier,
+                    min_s_val,
+                    max_s_val,
+                ),
+                direct,
+            )
+        else:  # Integer
+            slider.setRange(int(actual_min_val), int(actual_max_val))
+            slider.setValue(int(default_val))
+            slider.valueChanged.connect(partial(self._setValueSilently, spin_box), direct)
+            spin_box.valueChanged.connect(partial(self._setValueSilently, slider), direct)
 
     def _create_material_value_adjuster_widget(
         self,
@@ -833,16 +1557,12 @@ class MainWindow(QMainWindow):
         # Main container
         container = QWidget()
         container.setObjectName("MaterialCardContainer")
-        main_layout = QVBoxLayout(container)
-        main_layout.setContentsMargins(12, 12, 12, 12)
-        main_layout.setSpacing(10)
+        main_layout = _vbox(container, margins=(12, 12, 12, 12), spacing=10)
 
         # Parameter widget
         param_widget = QWidget()
         param_widget.setObjectName("ThresholdWidget")
-        param_layout = QVBoxLayout(param_widget)
-        param_layout.setContentsMargins(0, 0, 0, 0)
-        param_layout.setSpacing(8)
+        param_layout = _vbox(param_widget, spacing=8)
 
         # Label
         label_layout = QHBoxLayout()
@@ -858,81 +1578,43 @@ class MainWindow(QMainWindow):
         # Minus button
         minus_btn = QPushButton("-")
         minus_btn.setObjectName("CircleButton")
-        minus_btn.setFixedSize(36, 36)
+        minus_btn.setFixedSize(self.CIRCLE_BUTTON_SIZE)
         minus_btn.setToolTip(f"Decrease {label_text.lower()}")
         slider_value_layout.addWidget(minus_btn)
 
         # Value and slider container
         value_slider_widget = QWidget()
-        value_slider_layout = QVBoxLayout(value_slider_widget)
-        value_slider_layout.setContentsMargins(0, 0, 0, 0)
-        value_slider_layout.setSpacing(2)
 
         # Value display
-        spin_box = QDoubleSpinBox() if is_float else QSpinBox()
-        spin_box.setRange(min_val, max_val)
-        spin_box.setValue(default_val)
-        if is_float:
-            spin_box.setSingleStep(step_val)
-            spin_box.setDecimals(decimals)
-        else:  # QSpinBox
-            spin_box.setSingleStep(int(step_val))
+        spin_box = self._make_spinbox(
+            is_float, min_val, max_val, default_val, step_val, decimals
+        )
 
         spin_box.setAlignment(Qt.AlignCenter)
         spin_box.setButtonSymbols(QAbstractSpinBox.NoButtons)
         spin_box.setObjectName("MaterialValueDisplay")
-        value_slider_layout.addWidget(spin_box)
 
         # Slider
         slider = QSlider(Qt.Horizontal)
         slider.setObjectName("ThresholdSlider")
 
-        actual_min_val = min_val
-        actual_max_val = max_val
-        if min_val > max_val:  # Ensure min_val <= max_val for slider range logic
-            actual_min_val, actual_max_val = max_val, min_val
-
-        if is_float:
-            slider.setRange(
-                int(round(actual_min_val * slider_multiplier)),
-                int(round(actual_max_val * slider_multiplier)),
-            )
-            slider.setValue(int(round(default_val * slider_multiplier)))
-            slider.valueChanged.connect(
-                lambda val, s=spin_box, mult=slider_multiplier: s.setValue(val / mult)
-            )
-
-            # Correctly define min_s_val and max_s_val using slider_multiplier
-            min_s_val = int(round(actual_min_val * slider_multiplier))
-            max_s_val = int(round(actual_max_val * slider_multiplier))
-            spin_box.valueChanged.connect(
-                lambda val, s=slider, mult=slider_multiplier, min_s_local=min_s_val, max_s_local=max_s_val: s.setValue(
-                    max(min_s_local, min(max_s_local, int(round(val * mult))))
-                )
-            )
-        else:  # Integer
-            slider.setRange(int(actual_min_val), int(actual_max_val))
-            slider.setValue(int(default_val))
-            slider.valueChanged.connect(spin_box.setValue)
-            spin_box.valueChanged.connect(slider.setValue)
+        self._wire_slider_spinbox(
+            slider, spin_box, is_float, min_val, max_val, default_val, slider_multiplier
+        )
 
-        value_slider_layout.addWidget(slider)
+        _vbox(value_slider_widget, spin_box, slider, spacing=2)
         slider_value_layout.addWidget(value_slider_widget, 1)
 
         # Plus button
         plus_btn = QPushButton("+")
         plus_btn.setObjectName("CircleButton")
-        plus_btn.setFixedSize(36, 36)
+        plus_btn.setFixedSize(self.CIRCLE_BUTTON_SIZE)
         plus_btn.setToolTip(f"Increase {label_text.lower()}")
         slider_value_layout.addWidget(plus_btn)
 
         # Connect buttons
-        minus_btn.clicked.connect(
-            lambda: self._decrementSpinnerValue(spin_box, step_val)
-        )
-        plus_btn.clicked.connect(
-            lambda: self._incrementSpinnerValue(spin_box, step_val)
-        )
+        minus_btn.clicked.connect(spin_box.stepDown)
+        plus_btn.clicked.connect(spin_box.stepUp)
 
         param_layout.addLayout(slider_value_layout)
         main_layout.addWidget(param_widget)
@@ -958,31 +1640,20 @@ class MainWindow(QMainWindow):
         target_slider_attr=None,  # Attribute name to store the slider
     ):
         widget = QWidget()
-        h_layout = QHBoxLayout(widget)
-        h_layout.setContentsMargins(0, 0, 0, 0)
-        h_layout.setSpacing(4)
+        h_layout = _hbox(widget, spacing=4)
 
         minus_btn = QPushButton("-")
         minus_btn.setObjectName("SpinnerButton")
 
-        spin_box = QDoubleSpinBox() if is_float else QSpinBox()
-        spin_box.setRange(min_val, max_val)
-        spin_box.setValue(default_val)
-        if is_float:
-            spin_box.setSingleStep(step_val)
-            spin_box.setDecimals(decimals)
-        else:  # QSpinBox
-            spin_box.setSingleStep(int(step_val))
+        spin_box = self._make_spinbox(
+            is_float, min_val, max_val, default_val, step_val, decimals
+        )
 
         plus_btn = QPushButton("+")
         plus_btn.setObjectName("SpinnerButton")
 
-        minus_btn.clicked.connect(
-            lambda: self._decrementSpinnerValue(spin_box, step_val)
-        )
-        plus_btn.clicked.connect(
-            lambda: self._incrementSpinnerValue(spin_box, step_val)
-        )
+        minus_btn.clicked.connect(spin_box.stepDown)
+        plus_btn.clicked.connect(spin_box.stepUp)
 
         h_layout.addWidget(minus_btn)
         h_layout.addWidget(spin_box, 1)
@@ -991,43 +1662,13 @@ class MainWindow(QMainWindow):
         if target_spinbox_attr:
             setattr(self, target_spinbox_attr, spin_box)
 
-        v_layout_container = QVBoxLayout()
-        v_layout_container.setContentsMargins(0, 0, 0, 0)
-        v_layout_container.setSpacing(2)
-        v_layout_container.addWidget(widget)
+        v_layout_container = _vbox(None, widget, spacing=2)
 
         if target_slider_attr:
             slider = QSlider(Qt.Horizontal)
-            actual_min_val = min_val
-            actual_max_val = max_val
-            if min_val > max_val:  # Ensure min_val <= max_val for slider range logic
-                actual_min_val, actual_max_val = max_val, min_val
-
-            if is_float:
-                slider.setRange(
-                    int(round(actual_min_val * slider_multiplier)),
-                    int(round(actual_max_val * slider_multiplier)),
-                )
-                slider.setValue(int(round(default_val * slider_multiplier)))
-                slider.valueChanged.connect(
-                    lambda val, s=spin_box, mult=slider_multiplier: s.setValue(
-                        val / mult
-                    )
-                )
-
-                # Correctly define min_s_val and max_s_val using slider_multiplier from the outer scope
-                min_s_val = int(round(actual_min_val * slider_multiplier))
-                max_s_val = int(round(actual_max_val * slider_multiplier))
-                spin_box.valueChanged.connect(
-                    lambda val, s=slider, mult=slider_multiplier, min_s_local=min_s_val, max_s_local=max_s_val: s.setValue(
-                        max(min_s_local, min(max_s_local, int(round(val * mult))))
-                    )
-                )
-            else:  # Integer
-                slider.setRange(int(actual_min_val), int(actual_max_val))
-                slider.setValue(int(default_val))
-                slider.valueChanged.connect(spin_box.setValue)
-                spin_box.valueChanged.connect(slider.setValue)
+            self._wire_slider_spinbox(
+                slider, spin_box, is_float, min_val, max_val, default_val, slider_multiplier
+            )
 
             setattr(self, target_slider_attr, slider)
             v_layout_container.addWidget(slider)
@@ -1052,545 +1693,17 @@ class MainWindow(QMainWindow):
 
     def _applyStyles(self):
         """Applies QSS styles for a modern look based on M3."""
-        primary = "#6750A4"  # Purple
-        on_primary = "#FFFFFF"
-        primary_container = "#EADDFF"
-        on_primary_container = "#21005D"
-        secondary = "#9C27B0"  # Deeper purple
-        on_secondary = "#FFFFFF"
-        secondary_container = "#E8DEF8"
-        on_secondary_container = "#1D192B"
-        tertiary = "#E91E63"  # Pink
-        on_tertiary = "#FFFFFF"
-        tertiary_container = "#FFD8E4"
-        on_tertiary_container = "#31111D"
-        error = "#B3261E"
-        on_error = "#FFFFFF"
-        error_container = "#F9DEDC"
-        on_error_container = "#410E0B"
-        background = "#FFFBFE"
-        on_background = "#1C1B1F"
-        surface = "#FFFBFE"
-        on_surface = "#1C1B1F"
-        surface_variant = "#E7E0EC"
-        on_surface_variant = "#49454F"
-        outline = "#79747E"
-        hover_primary = "#EADDFF"
-        hover_secondary = "#E8DEF8"
-        selected_primary_container = "#D0BCFF"
-        disabled_bg = "#E0E0E0"
-        disabled_fg = "#A0A0A0"
-
-        styleSheet = f"""
-            QMainWindow {{
-                background-color: {background};
-                font-family: "Segoe UI", Arial, sans-serif;
-            }}
-            QWidget#LeftPanel {{
-                background-color: {surface};
-                border-right: 1px solid {outline};
-            }}
-            QMenuBar#MainMenuBar {{
-                background-color: {surface};
-                border-bottom: 1px solid {outline};
-                color: {on_surface};
-                padding: 2px;
-            }}
-            QMenuBar#MainMenuBar::item {{
-                padding: 5px 10px;
-                background-color: transparent;
-                color: {on_surface_variant};
-            }}
-            QMenuBar#MainMenuBar::item:selected {{
-                background-color: {primary_container};
-                color: {on_primary_container};
-            }}
-            QMenu {{
-                background-color: {surface} !important;
-                border: 1px solid {outline};
-                padding: 5px;
-                color: {on_surface};
-            }}
-            QMenu::item {{
-                padding: 6px 20px;
-                border-radius: 3px;
-                background-color: {surface} !important;
-                color: {on_surface};
-            }}
-            QMenu::item:selected {{
-                background-color: {primary_container} !important;
-                color: {on_primary_container};
-            }}
-            QMenu::item:disabled {{
-                color: {disabled_fg};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: {outline};
-                margin: 4px 0px;
-            }}
-            QToolBar#MainToolBar {{
-                background-color: {surface};
-                border-bottom: 1px solid {outline};
-                padding: 3px;
-                spacing: 4px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                padding: 5px;
-                margin: 1px;
-                border-radius: 4px;
-                color: {on_surface_variant};
-            }}
-            QToolButton:hover {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-                border: 1px solid {secondary_container};
-            }}
-            QToolButton:pressed {{
-                background-color: {selected_primary_container};
-                color: {on_primary_container};
-            }}
-            QToolButton:disabled {{
-                color: {disabled_fg};
-                background-color: transparent;
-                border: 1px solid transparent;
-            }}
-            QPushButton {{
-                background-color: {primary};
-                color: {on_primary};
-                border: 0px;
-                padding: 8px 12px;
-                border-radius: 16px;
-                font-size: 9pt;
-                min-height: 28px;
-                text-align: center;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {primary_container};
-                color: {on_primary_container};
-            }}
-            QPushButton:pressed {{
-                background-color: {selected_primary_container};
-                color: {on_primary_container};
-            }}
-            QPushButton:checked {{
-                background-color: {primary};
-                color: {on_primary};
-            }}
-            QPushButton:disabled {{
-                background-color: {disabled_bg};
-                color: {disabled_fg};
-            }}
-            QPushButton#OperationButton {{
-                background-color: {secondary};
-                color: {on_secondary};
-                text-align: left;
-                padding-left: 15px;
-                border-radius: 4px;
-            }}
-            QPushButton#OperationButton:hover {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-            }}
-            QPushButton#OperationButton:pressed {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-            }}
-            QPushButton#OperationButton:checked {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-                border: 1px solid {secondary};
-            }}
-            QPushButton#UtilityButton {{
-                background-color: {tertiary_container};
-                color: {on_tertiary_container};
-                border-radius: 4px;
-            }}
-            QPushButton#UtilityButton:hover {{
-                background-color: {tertiary};
-                color: {on_tertiary};
-            }}
-            QPushButton#UtilityButton:pressed {{
-                background-color: {tertiary};
-                color: {on_tertiary};
-            }}
-            QPushButton#UtilityButton:disabled {{
-                background-color: {disabled_bg};
-                color: {disabled_fg};
-            }}
-            QPushButton#SpinnerButton {{
-                background-color: {tertiary};
-                color: {on_tertiary};
-                min-width: 24px;
-                max-width: 24px;
-                min-height: 24px;
-                max-height: 24px;
-                padding: 0px;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 12px;
-            }}
-            QStatusBar#MainStatusBar {{
-                background-color: {surface_variant};
-                border-top: 1px solid {outline};
-                color: {on_surface_variant};
-                padding: 3px;
-            }}
-            QLabel#PanelTitleLabel {{
-                font-weight: bold;
-                font-size: 11pt;
-                padding: 6px 4px;
-                color: {primary};
-                border-bottom: 1px solid {outline};
-                margin-bottom: 5px;
-            }}
-            QWidget#ImagePanel {{
-                background-color: {surface};
-                border: 1px solid {outline};
-                border-radius: 4px;
-            }}
-            QLabel#PixmapLabel {{
-                background-color: {surface_variant};
-                border: 1px dashed {outline};
-                color: {on_surface_variant};
-                border-radius: 3px;
-                min-height: 200px;
-                padding: 10px;
-                font-style: normal;
-                text-align: center;
-            }}
-            QSplitter::handle {{
-                background-color: {outline};
-            }}
-            QSplitter::handle:horizontal {{
-                width: 1px;
-                margin: 0px 2px;
-            }}
-            QSplitter::handle:vertical {{
-                height: 1px;
-                margin: 2px 0px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {primary};
-            }}
-            QGroupBox {{ /* General GroupBox Style */
-                font-size: 9pt;
-                font-weight: normal;
-                color: {on_surface_variant};
-                border: 1px solid {outline};
-                border-radius: 4px;
-                margin-top: 15px; /* Space for title */
-                background-color: {surface};
-                padding: 10px; /* Internal padding */
-                padding-top: 15px; /* More padding at top */
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                margin-left: 10px; /* Indent title */
-                margin-top: -1px; /* Pull title up slightly */
-                padding: 2px 5px; /* Padding around title */
-                background-color: {surface}; /* Match background */
-                border-radius: 3px;
-                color: {on_surface_variant};
-                font-weight: bold;
-            }}
-            QGroupBox#LogGroup {{ /* Specific Log Group Style Overrides */
-                margin-top: 20px;
-                padding: 5px;
-                padding-top: 10px;
-            }}
-            QGroupBox#LogGroup::title {{
-                margin-left: 12px;
-                margin-top: -6px;
-                padding: 4px 8px;
-                background-color: {surface_variant};
-                color: {on_surface_variant};
-            }}
-            QTextBrowser#LogBox {{
-                background-color: {surface};
-                border: 0px;
-                color: {on_surface};
-                font-family: Consolas, Courier New, monospace;
-                font-size: 9pt;
-                padding: 5px;
-            }}
-            QListWidget#CategoryList {{
-                border: 1px solid {outline};
-                background-color: {surface};
-                padding: 1px;      /* Minimal padding for the list widget itself */
-                border-radius: 4px;
-                outline: 0;
-            }}
-            QListWidget#CategoryList::item {{
-                padding: 4px 8px;  /* Reduced padding for items */
-                margin: 0px;       /* No margin between items */
-                border-radius: 3px;
-                color: {on_surface};
-            }}
-            QListWidget#CategoryList::item:hover {{
-                background-color: {hover_secondary};
-                color: {on_secondary_container};
-            }}
-            QListWidget#CategoryList::item:selected {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-                font-weight: bold;
-                border-left: 3px solid {secondary};
-                padding-left: 7px;
-            }}
-            QWidget#OperationsStack {{
-                background-color: {surface};
-                border: 0px;
-                border-radius: 0px;
-                padding: 5px;
-            }}
-
-            /* --- Material Design 3 Slider --- */
-            QSlider::groove:horizontal {{
-                border-radius: 2px; /* Slightly rounded track ends */
-                height: 4px;        /* M3 typical track height */
-                background: {surface_variant}; /* Inactive track color */
-                margin: 0px;
-            }}
-            QSlider::sub-page:horizontal {{ /* Active part of the track */
-                background: {primary};
-                border-radius: 2px;
-                height: 4px;
-            }}
-            QSlider::add-page:horizontal {{ /* Inactive part of the track */
-                background: {surface_variant};
-                border-radius: 2px;
-                height: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {primary}; /* Handle color */
-                border: 2px solid {surface}; /* Border to make it pop from the track */
-                width: 20px;   /* M3 standard handle size */
-                height: 20px;
-                margin: -8px 0; /* Vertically center 20px handle on 4px track */
-                border-radius: 10px; /* Circular handle */
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {primary_container}; /* Lighter primary for hover */
-                border: 2px solid {primary_container};
-            }}
-            QSlider::handle:horizontal:pressed {{
-                background: {selected_primary_container}; /* More prominent for pressed */
-                border: 2px solid {selected_primary_container};
-            }}
-            /* --- End Material Design 3 Slider --- */
-
-            QSpinBox, QDoubleSpinBox {{
-                padding: 6px 8px;
-                border: 1px solid {outline};
-                border-radius: 12px;
-                background-color: {surface};
-                color: {on_surface};
-                min-width: 70px;
-                font-weight: 500;
-                selection-background-color: {primary_container};
-            }}
-            QSpinBox:hover, QDoubleSpinBox:hover {{
-                border: 1px solid {primary};
-                background-color: {surface_variant};
-            }}
-            QSpinBox:focus, QDoubleSpinBox:focus {{
-                border: 2px solid {primary};
-                padding: 5px 7px;
-            }}
-            QSpinBox::up-button, QDoubleSpinBox::up-button {{
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 24px;
-                height: 12px;
-                border: 0px;
-                border-top-right-radius: 8px;
-                background-color: {surface_variant};
-            }}
-            QSpinBox::down-button, QDoubleSpinBox::down-button {{
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 24px;
-                height: 12px;
-                border: 0px;
-                border-bottom-right-radius: 8px;
-                background-color: {surface_variant};
-            }}
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
-                background-color: {primary_container};
-            }}
-            QSpinBox::up-button:pressed, QDoubleSpinBox::up-button:pressed,
-            QSpinBox::down-button:pressed, QDoubleSpinBox::down-button:pressed {{
-                background-color: {primary};
-            }}
-            QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
-                width: 12px;
-                height: 6px;
-                background: {on_surface_variant};
-            }}
-            QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
-                width: 12px;
-                height: 6px;
-                background: {on_surface_variant};
-            }}
-            QSpinBox::up-arrow:hover, QDoubleSpinBox::up-arrow:hover,
-            QSpinBox::down-arrow:hover, QDoubleSpinBox::down-arrow:hover {{
-                background: {on_primary_container};
-            }}
-            
-            /* --- Material Design 3 Binary Threshold Components --- */
-            QDoubleSpinBox#MaterialValueDisplay {{
-                background-color: transparent;
-                border: none;
-                font-size: 16px;
-                font-weight: 500;
-                color: {on_primary_container};
-                padding: 4px;
-                text-align: center;
-            }}
-            
-            QWidget#ThresholdWidget {{
-                background-color: {surface};
-                border-radius: 8px;
-                padding: 8px;
-            }}
-            
-            QLabel#ParameterLabel {{
-                font-size: 14px;
-                font-weight: 500;
-                color: {on_surface_variant};
-                margin-bottom: 4px;
-            }}
-            
-            QPushButton#CircleButton {{
-                background-color: {tertiary};
-                color: {on_tertiary};
-                border-radius: 18px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-            }}
-            
-            QPushButton#CircleButton:hover {{
-                background-color: {secondary_container};
-                color: {on_secondary_container};
-            }}
-            
-            QPushButton#CircleButton:pressed {{
-                background-color: {secondary};
-                color: {on_secondary};
-            }}
-            
-            QSlider#ThresholdSlider::groove:horizontal {{
-                border-radius: 3px;
-                height: 6px;
-                background: {surface_variant};
-            }}
-            
-            QSlider#ThresholdSlider::sub-page:horizontal {{
-                background: {primary};
-                border-radius: 3px;
-                height: 6px;
-            }}
-            
-            QSlider#ThresholdSlider::add-page:horizontal {{
-                background: {surface_variant};
-                border-radius: 3px;
-                height: 6px;
-            }}
-            
-            QSlider#ThresholdSlider::handle:horizontal {{
-                background: {secondary};
-                border: 2px solid {surface};
-                width: 26px;
-                height: 26px;
-                margin: -10px 0;
-                border-radius: 13px;
-            }}
-            
-            QSlider#ThresholdSlider::handle:horizontal:hover {{
-                background: {primary_container};
-                border: 2px solid {primary};
-            }}
-            
-            QSlider#ThresholdSlider::handle:horizontal:pressed {{
-                background: {selected_primary_container};
-                border: 2px solid {primary};
-            }}
-            
-            QWidget#MaterialCardContainer {{
-                background-color: {surface};
-                border-radius: 12px;
-                border: 1px solid {outline};
-            }}
-            
-            QCheckBox#MaterialCheckbox {{
-                font-size: 14px;
-                color: {on_surface_variant};
-                spacing: 8px;
-                margin-top: 8px;
-            }}
-            
-            QCheckBox#MaterialCheckbox::indicator {{
-                width: 20px;
-                height: 20px;
-                border: 2px solid {outline};
-                border-radius: 2px;
-            }}
-            
-            QCheckBox#MaterialCheckbox::indicator:checked {{
-                background-color: {primary};
-                border: 2px solid {primary};
-            }}
-            
-            QCheckBox#MaterialCheckbox::indicator:hover {{
-                border: 2px solid {primary};
-            }}
-            /* --- End Material Design 3 Binary Threshold Components --- */
-            
-            QCheckBox {{
-                spacing: 5px;
-                color: {on_surface};
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 1px solid {outline};
-                border-radius: 3px;
-                background-color: {surface};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {primary};
-                border: 1px solid {primary};
-            }}
-            QCheckBox::indicator:hover {{
-                border: 1px solid {primary};
-            }}
-            QCheckBox:disabled {{
-                color: {disabled_fg};
-            }}
-            QCheckBox::indicator:disabled {{
-                background-color: {disabled_bg};
-                border: 1px solid {disabled_fg};
-            }}
-            QFormLayout {{
-                horizontal-spacing: 10px;
-                vertical-spacing: 8px;
-            }}
-            QLabel {{
-                color: {on_surface};
-                padding-top: 4px;
-            }}
-        """
-        self.setStyleSheet(styleSheet)
+        style_sheet = build_style_sheet()
+        # main.py installs the sheet application-wide; only a window created
+        # without that (e.g. embedded elsewhere) needs its own copy
+        if QApplication.instance().styleSheet() != style_sheet:
+            self.setStyleSheet(style_sheet)
 
     def _connectActions(self):
         """Connect actions and signals to slots."""
+        if self._actionsConnected:
+            return  # Connecting again would run every slot twice per signal
+        self._actionsConnected = True
         # File menu connections are now handled by FileActionsHandler
         if self.openSourceButton:
             self.openSourceButton.clicked.connect(self.file_handler.open_source)
@@ -1631,172 +1744,64 @@ class MainWindow(QMainWindow):
 
         # Conversion menu - Yeni image_operations'a bağlayalım
         self.rgbToGrayAction.triggered.connect(self.image_operations.apply_grayscale)
-        self.rgbToHsvAction.triggered.connect(lambda: self.image_operations.apply_hsv())
-        # Binary Threshold Apply button - bunu da güncelleyelim
-        if hasattr(self, "applyBinaryThresholdButton") and self.applyBinaryThresholdButton:
-            self.applyBinaryThresholdButton.clicked.connect(
-                lambda: self.image_operations.apply_binary_threshold(
-                    self.binaryThresholdSpinBox.value(),
-                    self.binaryThresholdInvertCheckbox.isChecked()
-                )
-            )
+        self.rgbToHsvAction.triggered.connect(self._runHsv)
 
         # Segmentation menu - Yeni image_operations'a bağlayalım
-        self.multiOtsuAction.triggered.connect(
-            lambda: self.image_operations.apply_multi_otsu(
-                self.otsuClassesSpinBox.value() if hasattr(self, "otsuClassesSpinBox") else 3
-            )
-        )
-        self.chanVeseAction.triggered.connect(
-            lambda: self.image_operations.apply_chan_vese(
-                max_iter=self.chanveseIterSpinBox.value() if hasattr(self, "chanveseIterSpinBox") else 200,
-                tol=self.chanveseTolSpinBox.value() if hasattr(self, "chanveseTolSpinBox") else 0.001
-            )
-        )
-        self.morphSnakesAction.triggered.connect(
-            lambda: self.image_operations.apply_morph_snakes(
-                iterations=self.morphIterSpinBox.value() if hasattr(self, "morphIterSpinBox") else 50,
-                smoothing=self.morphSmoothSpinBox.value() if hasattr(self, "morphSmoothSpinBox") else 3
-            )
-        )
+        self.multiOtsuAction.triggered.connect(self._runMultiOtsu)
+        self.chanVeseAction.triggered.connect(self._runChanVese)
+        self.morphSnakesAction.triggered.connect(self._runMorphSnakes)
 
         # Edge Detection menu - Yeni image_operations'a bağlayalım
-        self.robertsAction.triggered.connect(
-            lambda: self.image_operations.apply_roberts()
-        )
-        self.sobelAction.triggered.connect(
-            lambda: self.image_operations.apply_sobel(
-                **self._get_edge_detection_params()
-            )
-        )
-        self.scharrAction.triggered.connect(
-            lambda: self.image_operations.apply_scharr(
-                **self._get_edge_detection_params()
-            )
-        )
-        self.prewittAction.triggered.connect(
-            lambda: self.image_operations.apply_prewitt(
-                **self._get_edge_detection_params()
-            )
-        )
-
-        self.categoryList.currentRowChanged.connect(
-            self.operationsStack.setCurrentIndex
-        )
-
-        # Connect parameter changes
-        if hasattr(self, "edgeThresholdSpinBox") and self.edgeThresholdSpinBox:
-            self.edgeThresholdSpinBox.valueChanged.connect(self._edge_params_changed)
-        else:
-            print("DEBUG: edgeThresholdSpinBox not found during _connectActions!")
+        self.robertsAction.triggered.connect(self._runRoberts)
+        self.sobelAction.triggered.connect(self._runSobel)
+        self.scharrAction.triggered.connect(self._runScharr)
+        self.prewittAction.triggered.connect(self._runPrewitt)
+
+        self.categoryList.currentRowChanged.connect(self._showOperationPage)
+
+    def _connectConversionPage(self):
+        """Connects the Conversion page widgets once the page is built."""
+        self.rgbToGrayButton.clicked.connect(self.image_operations.apply_grayscale)
+        self.rgbToHsvButton.clicked.connect(self._runHsv)
+        self.applyBinaryThresholdButton.clicked.connect(self._applyBinaryThreshold)
+        self._operationButtons += [
+            self.rgbToGrayButton,
+            self.rgbToHsvButton,
+            self.applyBinaryThresholdButton,
+        ]
 
-        if hasattr(self, "edgeSigmaSpinBox") and self.edgeSigmaSpinBox:
-            self.edgeSigmaSpinBox.valueChanged.connect(self._edge_params_changed)
-        else:
-            print("DEBUG: edgeSigmaSpinBox not found during _connectActions!")
+    def _connectSegmentationPage(self):
+        """Connects the Segmentation page widgets once the page is built."""
+        self.multiOtsuButton.clicked.connect(self._runMultiOtsu)
+        self.chanVeseButton.clicked.connect(self._runChanVese)
+        self.morphSnakesButton.clicked.connect(self._runMorphSnakes)
+        self._operationButtons += [
+            self.multiOtsuButton,
+            self.chanVeseButton,
+            self.morphSnakesButton,
+        ]
 
-        if hasattr(self, "edgeThresholdSlider") and self.edgeThresholdSlider:
-            self.edgeThresholdSlider.valueChanged.connect(
-                self._updateThresholdFromSlider
-            )
-        else:
-            print("DEBUG: edgeThresholdSlider not found during _connectActions!")
-
-        # edgeThresholdSpinBox's valueChanged is already connected to _edge_params_changed.
-        if (
-            hasattr(self, "edgeThresholdSpinBox")
-            and self.edgeThresholdSpinBox
-            and hasattr(self, "edgeThresholdSlider")
-            and self.edgeThresholdSlider
-        ):
-            self.edgeThresholdSpinBox.valueChanged.connect(self._updateThresholdSlider)
-        else:
-            if (
-                not hasattr(self, "edgeThresholdSpinBox")
-                or not self.edgeThresholdSpinBox
-            ):
-                print(
-                    "DEBUG: edgeThresholdSpinBox (for slider update) not found during _connectActions!"
-                )
-            if not hasattr(self, "edgeThresholdSlider") or not self.edgeThresholdSlider:
-                print(
-                    "DEBUG: edgeThresholdSlider (for spinbox update) not found during _connectActions!"
-                )
-
-        if hasattr(self, "edgeSigmaSlider") and self.edgeSigmaSlider:
-            self.edgeSigmaSlider.valueChanged.connect(self._updateSigmaFromSlider)
-        else:
-            print("DEBUG: edgeSigmaSlider not found during _connectActions!")
-
-        if (
-            hasattr(self, "edgeSigmaSpinBox")
-            and self.edgeSigmaSpinBox
-            and hasattr(self, "edgeSigmaSlider")
-            and self.edgeSigmaSlider
-        ):
-            self.edgeSigmaSpinBox.valueChanged.connect(self._updateSigmaSlider)
-        else:
-            if not hasattr(self, "edgeSigmaSpinBox") or not self.edgeSigmaSpinBox:
-                print(
-                    "DEBUG: edgeSigmaSpinBox (for slider update) not found during _connectActions!"
-                )
-            if not hasattr(self, "edgeSigmaSlider") or not self.edgeSigmaSlider:
-                print(
-                    "DEBUG: edgeSigmaSlider (for spinbox update) not found during _connectActions!"
-                )
-
-        # Connect Binary Threshold controls
-        if hasattr(self, "binaryThresholdSlider") and self.binaryThresholdSlider:
-            self.binaryThresholdSlider.valueChanged.connect(
-                self._updateBinaryThresholdFromSlider
-            )
-        else:
-            print("DEBUG: binaryThresholdSlider not found during _connectActions!")
-        if hasattr(self, "binaryThresholdSpinBox") and self.binaryThresholdSpinBox:
-            self.binaryThresholdSpinBox.valueChanged.connect(
-                self._updateBinaryThresholdSlider
-            )
-        else:
-            print("DEBUG: binaryThresholdSpinBox not found during _connectActions!")
-
-        # --- Conversion Page PushButtons ---
-        if hasattr(self, "rgbToGrayButton") and self.rgbToGrayButton:
-            self.rgbToGrayButton.clicked.connect(self.image_operations.apply_grayscale)
-        if hasattr(self, "rgbToHsvButton") and self.rgbToHsvButton:
-            self.rgbToHsvButton.clicked.connect(lambda: self.image_operations.apply_hsv())
-
-        # Segmentation Page PushButtons
-        if hasattr(self, "multiOtsuButton") and self.multiOtsuButton:
-            self.multiOtsuButton.clicked.connect(lambda: self.image_operations.apply_multi_otsu(
-                self.otsuClassesSpinBox.value() if hasattr(self, "otsuClassesSpinBox") else 3
-            ))
-        if hasattr(self, "chanVeseButton") and self.chanVeseButton:
-            self.chanVeseButton.clicked.connect(lambda: self.image_operations.apply_chan_vese(
-                max_iter=self.chanveseIterSpinBox.value() if hasattr(self, "chanveseIterSpinBox") else 200,
-                tol=self.chanveseTolSpinBox.value() if hasattr(self, "chanveseTolSpinBox") else 0.001
-            ))
-        if hasattr(self, "morphSnakesButton") and self.morphSnakesButton:
-            self.morphSnakesButton.clicked.connect(lambda: self.image_operations.apply_morph_snakes(
-                iterations=self.morphIterSpinBox.value() if hasattr(self, "morphIterSpinBox") else 50,
-                smoothing=self.morphSmoothSpinBox.value() if hasattr(self, "morphSmoothSpinBox") else 3
-            ))
-
-        # Edge Detection Page PushButtons
-        if hasattr(self, "robertsButton") and self.robertsButton:
-            self.robertsButton.clicked.connect(lambda: self.image_operations.apply_roberts())
-        if hasattr(self, "sobelButton") and self.sobelButton:
-            self.sobelButton.clicked.connect(lambda: self.image_operations.apply_sobel(
-                **self._get_edge_detection_params()
-            ))
-        if hasattr(self, "scharrButton") and self.scharrButton:
-            self.scharrButton.clicked.connect(lambda: self.image_operations.apply_scharr(
-                **self._get_edge_detection_params()
-            ))
-        if hasattr(self, "prewittButton") and self.prewittButton:
-            self.prewittButton.clicked.connect(lambda: self.image_operations.apply_prewitt(
-                **self._get_edge_detection_params()
-            ))
-        # --- YENİ EKLENECEK BAĞLANTILAR SONU ---
+    def _connectEdgePage(self):
+        """Connects the Edge Detection page widgets once the page is built."""
+        self.robertsButton.clicked.connect(self._runRoberts)
+        self.sobelButton.clicked.connect(self._runSobel)
+        self.scharrButton.clicked.connect(self._runScharr)
+        self.prewittButton.clicked.connect(self._runPrewitt)
+
+        # Parameter changes (GUI-thread only, so connected directly). The
+        # adjuster widgets keep each slider/spinbox pair in sync silently, so
+        # whichever of the two the user moved reports the change
+        direct = Qt.DirectConnection
+        self.edgeThresholdSpinBox.valueChanged.connect(self._edge_params_changed, direct)
+        self.edgeSigmaSpinBox.valueChanged.connect(self._edge_params_changed, direct)
+        self.edgeThresholdSlider.valueChanged.connect(self._edge_params_changed, direct)
+        self.edgeSigmaSlider.valueChanged.connect(self._edge_params_changed, direct)
+        self._operationButtons += [
+            self.robertsButton,
+            self.sobelButton,
+            self.scharrButton,
+            self.prewittButton,
+        ]
 
     def _runOperation(self, operation, is_redo=False):
         """Runs an operation in a separate thread using operation_handler."""
@@ -1808,17 +1813,37 @@ class MainWindow(QMainWindow):
         invert = self.binaryThresholdInvertCheckbox.isChecked()
         self.image_operations.apply_binary_threshold(threshold, invert)
 
-    def _updateBinaryThresholdFromSlider(self, value):
-        """Update binary threshold spinbox from slider value"""
-        self.binaryThresholdSpinBox.blockSignals(True)
-        self.binaryThresholdSpinBox.setValue(value / 100.0)
-        self.binaryThresholdSpinBox.blockSignals(False)
+    # Slots shared by the operation menu actions and the page buttons; they
+    # take no arguments, so the clicked/triggered 'checked' flag is dropped
+    def _runHsv(self):
+        self.image_operations.apply_hsv()
+
+    def _runMultiOtsu(self):
+        self.image_operations.apply_multi_otsu(self._paramValue("otsuClassesSpinBox"))
+
+    def _runChanVese(self):
+        self.image_operations.apply_chan_vese(
+            max_iter=self._paramValue("chanveseIterSpinBox"),
+            tol=self._paramValue("chanveseTolSpinBox"),
+        )
+
+    def _runMorphSnakes(self):
+        self.image_operations.apply_morph_snakes(
+            iterations=self._paramValue("morphIterSpinBox"),
+            smoothing=self._paramValue("morphSmoothSpinBox"),
+        )
 
-    def _updateBinaryThresholdSlider(self, value):
-        """Update binary threshold slider from spinbox value"""
-        self.binaryThresholdSlider.blockSignals(True)
-        self.binaryThresholdSlider.setValue(int(value * 100))
-        self.binaryThresholdSlider.blockSignals(False)
+    def _runRoberts(self):
+        self.image_operations.apply_roberts()
+
+    def _runSobel(self):
+        self.image_operations.apply_sobel(**self._get_edge_detection_params())
+
+    def _runScharr(self):
+        self.image_operations.apply_scharr(**self._get_edge_detection_params())
+
+    def _runPrewitt(self):
+        self.image_operations.apply_prewitt(**self._get_edge_detection_params())
 
     def _undo(self):
         """Delegates undo operation to EditActionsHandler."""
@@ -1832,9 +1857,7 @@ class MainWindow(QMainWindow):
 
     def _showNoImageWarning(self):
         """Shows a warning message when no image is loaded."""
-        QMessageBox.warning(
-            self, "No Image Loaded", "Please load an image before applying operations."
-        )
+        self.operation_handler.show_no_image_warning()
 
     def _updateProgress(self, progress):
         """Updates the progress bar in the progress popup."""
@@ -1857,6 +1880,15 @@ class MainWindow(QMainWindow):
         if source_loaded is None:
             source_loaded = self.current_source_image is not None
 
+        # Repaint once for the whole batch of enabled-state changes
+        self.setUpdatesEnabled(False)
+        try:
+            self._updateComponentStates(source_loaded)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _updateComponentStates(self, source_loaded):
+        """Sets the enabled state of actions, buttons and panels (see _activateUIComponents)."""
         output_exists = self.current_output_image is not None
         # Get undo/redo state from handler
         # can_undo = self.edit_handler.can_undo() # Not needed directly here anymore
@@ -1909,22 +1941,9 @@ class MainWindow(QMainWindow):
         self.categoryList.setEnabled(source_loaded)
         self.operationsStack.setEnabled(source_loaded)
 
-        # Enable/disable all operation buttons based on source_loaded
-        buttons_to_toggle = [
-            self.rgbToGrayButton,
-            self.rgbToHsvButton,
-            self.applyBinaryThresholdButton,
-            self.multiOtsuButton,
-            self.chanVeseButton,
-            self.morphSnakesButton,
-            self.robertsButton,
-            self.sobelButton,
-            self.scharrButton,
-            self.prewittButton,
-        ]
-        for button in buttons_to_toggle:
-            if button:
-                button.setEnabled(source_loaded)
+        # Enable/disable the operation buttons of built pages based on source_loaded
+        for button in self._operationButtons:
+            button.setEnabled(source_loaded)
 
         self.conversionMenu.setEnabled(source_loaded)
         self.segmentationMenu.setEnabled(source_loaded)
@@ -1940,6 +1959,10 @@ class MainWindow(QMainWindow):
     def _edge_params_changed(self):
         # This method seems misplaced now, was likely related to edge processor
         # We might need a general param changed handler if we want live preview
+        # Restarting the timer coalesces a slider drag into a single update
+        self._edgeParamsTimer.start()
+
+    def _showEdgeParams(self):
         self.statusBar.showMessage(
             f"Edge Params: Threshold={self.edgeThresholdSpinBox.value():.2f}, Sigma={self.edgeSigmaSpinBox.value():.1f}",
             3000,
@@ -2043,10 +2066,17 @@ class MainWindow(QMainWindow):
             self._logMessage(error_msg, "error")
             QMessageBox.critical(self, "Operation Error", error_msg)
 
+    def _paramValue(self, spin_box_attr):
+        """Current value of a parameter spin box, or its default while its page is unbuilt."""
+        spin_box = getattr(self, spin_box_attr, None)
+        if spin_box is None:
+            return self.PARAM_DEFAULTS[spin_box_attr]
+        return spin_box.value()
+
     def _get_edge_detection_params(self):
         """Helper to get current edge detection parameters from UI."""
-        threshold = self.edgeThresholdSpinBox.value()
-        sigma = self.edgeSigmaSpinBox.value()
+        threshold = self._paramValue("edgeThresholdSpinBox")
+        sigma = self._paramValue("edgeSigmaSpinBox")
         # Use None for threshold if value is 0.0, indicating auto-threshold
         return self.image_operations.get_edge_detection_params(threshold, sigma)
 
@@ -2094,36 +2124,6 @@ class MainWindow(QMainWindow):
         op = PrewittOperation(threshold=params["threshold"], sigma=params["sigma"])
         self._runOperation(op)
 
-    # --- Edge Detection Parameter Sync Methods ---
-
-    def _updateThresholdFromSlider(self, value):
-        """Update threshold spinbox from slider value (0-100 -> 0.0-1.0)."""
-        self.edgeThresholdSpinBox.blockSignals(True)
-        self.edgeThresholdSpinBox.setValue(value / 100.0)
-        self.edgeThresholdSpinBox.blockSignals(False)
-        self._edge_params_changed()  # Update status bar or trigger preview
-
-    def _updateThresholdSlider(self, value):
-        """Update threshold slider from spinbox value (0.0-1.0 -> 0-100)."""
-        self.edgeThresholdSlider.blockSignals(True)
-        self.edgeThresholdSlider.setValue(int(value * 100))
-        self.edgeThresholdSlider.blockSignals(False)
-        # No need to call _edge_params_changed here, spinbox triggers it
-
-    def _updateSigmaFromSlider(self, value):
-        """Update sigma spinbox from slider value (0-50 -> 0.0-5.0)."""
-        self.edgeSigmaSpinBox.blockSignals(True)
-        self.edgeSigmaSpinBox.setValue(value / 10.0)
-        self.edgeSigmaSpinBox.blockSignals(False)
-        self._edge_params_changed()  # Update status bar or trigger preview
-
-    def _updateSigmaSlider(self, value):
-        """Update sigma slider from spinbox value (0.0-5.0 -> 0-50)."""
-        self.edgeSigmaSlider.blockSignals(True)
-        self.edgeSigmaSlider.setValue(int(value * 10))
-        self.edgeSigmaSlider.blockSignals(False)
-        # No need to call _edge_params_changed here, spinbox triggers it
-
     def initUI(self):
         self.setWindowTitle("Parameter Adjustment")
 
@@ -2131,117 +2131,28 @@ class MainWindow(QMainWindow):
 
     def _updateImageDisplay(self, label: QLabel, image_data: Union[np.ndarray, None]):
         """Updates a QLabel with a NumPy image array."""
-        if image_data is None:
-            # Determine placeholder text based on label
-            placeholder = "No Image Data"
-            if label == self.sourcePixmapLabel:
-                placeholder = "Drop or Open Image/Video"
-            elif label == self.outputPixmapLabel:
-                placeholder = "Processing Result Area"
-            label.setText(placeholder)
-            label.setPixmap(QPixmap())  # Need QPixmap import
-            return
-
-        try:
-            img_display = image_data
-            # Ensure image is uint8 for QPixmap
-            if img_display.dtype != np.uint8:
-                # Check if it's a float image in [0, 1]
-                if (
-                    np.issubdtype(img_display.dtype, np.floating)
-                    and img_display.max() <= 1.0
-                    and img_display.min() >= 0.0
-                ):
-                    img_display = (img_display * 255).astype(np.uint8)
-                else:
-                    # Attempt conversion for other types (like bool, int, or float outside [0,1])
-                    # img_as_ubyte handles scaling for floats outside [0,1] and converts other types
-                    self._logMessage(
-                        f"Converting image from {img_display.dtype} to uint8 for display.",
-                        "info",
-                    )
-                    img_display = img_as_ubyte(img_display)
-
-            # If still not uint8 after conversion attempts, log error
-            if img_display.dtype != np.uint8:
-                raise TypeError(
-                    f"Could not convert image to uint8 for display. Current dtype: {img_display.dtype}"
-                )
-
-            height, width = img_display.shape[:2]
-            bytes_per_line = width
-            format = QImage.Format_Grayscale8  # Default format
-
-            if img_display.ndim == 3:
-                channels = img_display.shape[2]
-                if channels == 4:
-                    format = QImage.Format_RGBA8888
-                    bytes_per_line = 4 * width
-                elif channels == 3:
-                    format = QImage.Format_RGB888
-                    bytes_per_line = 3 * width
-                else:
-                    # Fallback: try displaying the first channel as grayscale for unsupported channel counts
-                    self._logMessage(
-                        f"Displaying first channel of {channels}-channel image as grayscale.",
-                        "warning",
-                    )
-                    img_display = img_display[:, :, 0]
-                    format = QImage.Format_Grayscale8
-                    bytes_per_line = width  # Recalculate bytes per line
-                    # Ensure the single channel is contiguous in memory
-                    if not img_display.flags["C_CONTIGUOUS"]:
-                        img_display = np.ascontiguousarray(img_display)
-
-            elif img_display.ndim != 2:
-                self._logMessage(
-                    f"Cannot display image with {img_display.ndim} dimensions.", "error"
-                )
-                label.setText("Display Error")
-                label.setPixmap(QPixmap())
-                return
-            else:  # ndim == 2, ensure it's contiguous
-                format = QImage.Format_Grayscale8
-                bytes_per_line = width
-                if not img_display.flags["C_CONTIGUOUS"]:
-                    img_display = np.ascontiguousarray(img_display)
-
-            # Create QImage directly from numpy array data
-            qimage = QImage(img_display.data, width, height, bytes_per_line, format)
-
-            # QImage from data might share memory; create a copy for safety
-            qimage_copy = qimage.copy()
-
-            # Important: For RGB images, check if byte order needs swapping (BGR vs RGB)
-            # QImage.Format_RGB888 assumes RGB order. If your numpy array is BGR (e.g., from OpenCV *without conversion*),
-            # you might need qimage_copy = qimage_copy.rgbSwapped()
-            # Since we mostly use skimage which prefers RGB, swapping is usually NOT needed here.
-
-            pixmap = QPixmap.fromImage(qimage_copy)
-
-            # Scale pixmap to fit label while keeping aspect ratio
-            # Use label.size() available at the moment of update
-            scaled_pixmap = pixmap.scaled(
-                label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            label.setPixmap(scaled_pixmap)
-            label.setText("")  # Clear placeholder text
-
-        except Exception as e:
-            import traceback
-
-            self._logMessage(
-                f"Error displaying image: {e}\n{traceback.format_exc()}", "error"
-            )
-            label.setText("Display Error")
-            label.setPixmap(QPixmap())
+        self.operation_handler.update_image_display(label, image_data)
 
     def resizeEvent(self, event):
         """Handle window resize to re-scale images."""
         super().resizeEvent(event)
-        # Rescale images displayed in labels when window size changes
-        # Check if labels exist before trying to update
+        # Rescale images displayed in labels when window size changes; the
+        # cached display image is reused unless the shown array has changed.
+        # Cached images get a fast rescale now and a smooth one once resizing
+        # settles
+        handler = self.operation_handler
+        if self.sourcePixmapLabel and self.current_source_image is not None:
+            if not handler.rescale_cached(self.sourcePixmapLabel, self.current_source_image, smooth=False):
+                handler.update_image_display(self.sourcePixmapLabel, self.current_source_image)
+        if self.outputPixmapLabel and self.current_output_image is not None:
+            if not handler.rescale_cached(self.outputPixmapLabel, self.current_output_image, smooth=False):
+                handler.update_image_display(self.outputPixmapLabel, self.current_output_image)
+        self._smoothRescaleTimer.start()
+
+    def _finalizeSmoothRescale(self):
+        """Redoes the displayed images with smooth scaling after a resize settles."""
+        handler = self.operation_handler
         if self.sourcePixmapLabel and self.current_source_image is not None:
-            self.operation_handler.update_image_display(self.sourcePixmapLabel, self.current_source_image)
+            handler.rescale_cached(self.sourcePixmapLabel, self.current_source_image)
         if self.outputPixmapLabel and self.current_output_image is not None:
-            self.operation_handler.update_image_display(self.outputPixmapLabel, self.current_output_image)
+            handler.rescale_cached(self.outputPixmapLabel, self.current_output_image)
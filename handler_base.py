@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QMenu
 
 
@@ -9,6 +11,12 @@ if TYPE_CHECKING:
     from gui import MainWindow
 
 
+@lru_cache(maxsize=None)
+def cached_icon(path: str) -> QIcon:
+    """Returns a shared QIcon for 'path', so each icon file is only loaded once."""
+    return QIcon(path)
+
+
 class BaseActionsHandler(ABC):
     """Base class for handling menu actions related to the main window."""
 
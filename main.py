@@ -4,7 +4,7 @@ from PyQt5.QtWidgets import QApplication
 
 # Assuming your main window class is MainWindow in gui.py
 try:
-    from gui import MainWindow
+    from gui import MainWindow, build_style_sheet
 except ImportError as e:
     print(f"Error importing MainWindow from gui.py: {e}")
     print("Please ensure gui.py exists and contains the MainWindow class.")
@@ -17,6 +17,10 @@ if __name__ == "__main__":
     # Apply a style if desired (optional, e.g., 'Fusion')
     # app.setStyle('Fusion')
 
+    # Install the style sheet once for the whole application, before any
+    # widget exists, so every widget is polished against it exactly once
+    app.setStyleSheet(build_style_sheet())
+
     # Create and show the main window
     mainWindow = MainWindow()
     # mainWindow.show() # The show() call is already in MainWindow's __init__
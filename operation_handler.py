@@ -1,12 +1,86 @@
 import numpy as np
-from PyQt5.QtWidgets import QLabel, QMessageBox, QApplication
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QLabel, QMessageBox
+from PyQt5.QtCore import Qt, QThreadPool
 
 from typing import Union, Callable
 
-from worker import WorkerThread
+from worker import OperationRunnable
 from progress_dialog import ProgressPopup
-from skimage import img_as_ubyte
+
+
+def _to_display_uint8(image_data: np.ndarray) -> np.ndarray:
+    """
+    Converts a bool, integer or float image to uint8 for display in one pass,
+    giving the same values as skimage's img_as_ubyte.
+
+    Floats are taken as [0, 1] intensities, rounded and clipped (img_as_ubyte
+    would reject values outside [-1, 1]); integer types keep their top 8 bits
+    and negative values become 0.
+    """
+    if image_data.dtype == np.bool_:
+        return image_data.view(np.uint8) * np.uint8(255)
+    if np.issubdtype(image_data.dtype, np.floating):
+        # float32 math for float16/32 input, float64 for float64, as skimage does
+        scaled = np.multiply(
+            image_data, 255, dtype=np.promote_types(image_data.dtype, np.float32)
+        )
+        np.rint(scaled, out=scaled)
+        return np.clip(scaled, 0, 255, out=scaled).astype(np.uint8)
+    if image_data.dtype == np.int8:
+        # 7 value bits widen to 8; repeating the top bit maps 127 to 255
+        positive = np.maximum(image_data, 0).view(np.uint8)
+        return (positive << 1) | (positive >> 6)
+    if np.issubdtype(image_data.dtype, np.signedinteger):
+        shift = image_data.dtype.itemsize * 8 - 9
+        return (np.maximum(image_data, 0) >> shift).astype(np.uint8)
+    if np.issubdtype(image_data.dtype, np.unsignedinteger):
+        shift = image_data.dtype.itemsize * 8 - 8
+        return (image_data >> shift).astype(np.uint8)
+    raise TypeError(f"Unsupported image dtype for display: {image_data.dtype}")
+
+
+def _uint8_display_layout(image_data: np.ndarray):
+    """
+    Returns (bytes_per_line, QImage format) when a C-contiguous uint8 image can
+    be handed to QImage as it is, or None when it needs converting first.
+    """
+    from PyQt5.QtGui import QImage
+
+    if image_data.dtype != np.uint8 or not image_data.flags["C_CONTIGUOUS"]:
+        return None
+    width = image_data.shape[1] if image_data.ndim >= 2 else 0
+    if image_data.ndim == 2:
+        return width, QImage.Format_Grayscale8
+    if image_data.ndim == 3:
+        channels = image_data.shape[2]
+        if channels == 3:
+            return 3 * width, QImage.Format_RGB888
+        if channels == 4:
+            return 4 * width, QImage.Format_RGBA8888
+    return None
+
+
+def _ndarray_to_qimage(img_display, bytes_per_line, format):
+    """
+    Wraps a contiguous uint8 image in a QImage without copying; the array must
+    stay referenced for as long as the QImage is used.
+    """
+    from PyQt5.QtGui import QImage
+
+    height, width = img_display.shape[:2]
+    return QImage(img_display.data, width, height, bytes_per_line, format)
+
+
+def _scaled_pixmap(qimage, size, transform=Qt.SmoothTransformation):
+    """
+    Scales a QImage to fit 'size' (keeping aspect ratio) and returns it as a
+    QPixmap. Scaling produces an independent image, so only the label-sized
+    result is converted to a pixmap.
+    """
+    from PyQt5.QtGui import QPixmap
+
+    scaled = qimage.scaled(size, Qt.KeepAspectRatio, transform)
+    return QPixmap.fromImage(scaled)
 
 
 class OperationHandler:
@@ -23,7 +97,16 @@ class OperationHandler:
         self.current_source_image = None
         self.current_output_image = None
         self.progress_popup = None
-        self.worker_thread = None
+        self.current_runnable = None
+        # Bumped for every run; results and progress of older runs are dropped
+        self._run_sequence = 0
+        # Built on first use and reused, instead of a new message box per warning
+        self._no_image_box = None
+        # label -> (image_data, uint8 display array, QImage over that array), so
+        # a resize only rescales instead of converting the array again
+        self._display_cache = {}
+        # label -> size of its last smooth scaling, None after a fast one
+        self._smooth_sizes = {}
 
     def set_images(self, source_image, output_image):
         """Sets the current source and output images."""
@@ -38,8 +121,12 @@ class OperationHandler:
             self.progress_popup.reset()
         return self.progress_popup
 
+    def is_busy(self) -> bool:
+        """True while an operation runs on the thread pool and its result is pending."""
+        return self.current_runnable is not None
+
     def run_operation(self, operation, is_redo=False):
-        """Runs an operation in a separate thread."""
+        """Runs an operation on the global thread pool."""
         if self.main_window.current_source_image is None:
             self.show_no_image_warning()
             return
@@ -60,19 +147,31 @@ class OperationHandler:
         )
         self.progress_popup.show()
         self.progress_popup.raise_()
-        QApplication.processEvents()
 
-        # Pass the is_redo flag to the handler via the thread if needed
-        self.worker_thread = WorkerThread(
-            operation, input_image_for_op, self.progress_popup.update_progress
+        # A newer run supersedes any still queued or in flight
+        self._run_sequence += 1
+        sequence = self._run_sequence
+
+        def is_current():
+            return sequence == self._run_sequence
+
+        self.current_runnable = OperationRunnable(
+            operation, input_image_for_op, is_current
         )
-        # Connect with a lambda to pass the is_redo flag to the handler
-        self.worker_thread.operation_complete.connect(
-            lambda result, op, error: self.handle_operation_complete(
-                result, op, error, is_redo
-            )
+        # Worker signals are emitted from a pool thread; queue them to the GUI thread
+        self.current_runnable.signals.progress.connect(
+            self.progress_popup.update_progress, Qt.QueuedConnection
+        )
+
+        def on_complete(result, op, error):
+            # Pass the is_redo flag through; ignore runs that were superseded
+            if is_current():
+                self.handle_operation_complete(result, op, error, is_redo)
+
+        self.current_runnable.signals.operation_complete.connect(
+            on_complete, Qt.QueuedConnection
         )
-        self.worker_thread.start()
+        QThreadPool.globalInstance().start(self.current_runnable)
 
     def handle_operation_complete(self, result, operation, error, is_redo=False):
         """Handles the completion of an operation."""
@@ -98,7 +197,7 @@ class OperationHandler:
                 # Yeni undo mantığı - önceki durumu kaydet (redo değilse)
                 if not is_redo:
                     # Yeni görüntü ve başlık uygulanmadan önceki mevcut durumu kaydet
-                    previous_image_data = self.main_window.current_output_image.copy() if self.main_window.current_output_image is not None else None
+                    previous_image_data = self.main_window.current_output_image
                     previous_title = self.main_window.outputTitleLabel.text() if self.main_window.current_output_image is not None else "Output"
                     
                     # Eski durumu undo_stack'e ekle
@@ -132,7 +231,7 @@ class OperationHandler:
                 )
 
             self.main_window._activateUIComponents()  # Update UI components
-            self.worker_thread = None  # Clear thread reference
+            self.current_runnable = None  # Clear runnable reference
 
         except Exception as e:
             # Catch any unexpected errors in the handler itself
@@ -144,13 +243,19 @@ class OperationHandler:
                 "Error",
                 f"An unexpected error occurred while completing the operation:\n{str(e)}",
             )
-            self.worker_thread = None  # Ensure thread is cleared even on error
+            self.current_runnable = None  # Ensure it is cleared even on error
 
     def show_no_image_warning(self):
         """Shows a warning message when no image is loaded."""
-        QMessageBox.warning(
-            self.main_window, "No Image Loaded", "Please load an image before applying operations."
-        )
+        if self._no_image_box is None:
+            self._no_image_box = QMessageBox(
+                QMessageBox.Warning,
+                "No Image Loaded",
+                "Please load an image before applying operations.",
+                QMessageBox.Ok,
+                self.main_window,
+            )
+        self._no_image_box.exec_()
 
     def update_image_display(self, label: QLabel, image_data: Union[np.ndarray, None]):
         """Updates a QLabel with a NumPy image array."""
@@ -165,26 +270,27 @@ class OperationHandler:
                 placeholder = "Processing Result Area"
             label.setText(placeholder)
             label.setPixmap(QPixmap())
+            self._display_cache.pop(label, None)
+            self._smooth_sizes.pop(label, None)
             return
 
         try:
+            # Common case: already displayable uint8, skip the conversion checks
+            layout = _uint8_display_layout(image_data)
+            if layout is not None:
+                self._show_display_image(label, image_data, image_data, *layout)
+                return
+
             img_display = image_data
             # Ensure image is uint8 for QPixmap
             if img_display.dtype != np.uint8:
-                # Check if it's a float image in [0, 1]
-                if (
-                    np.issubdtype(img_display.dtype, np.floating)
-                    and img_display.max() <= 1.0
-                    and img_display.min() >= 0.0
-                ):
-                    img_display = (img_display * 255).astype(np.uint8)
-                else:
-                    # Attempt conversion for other types
+                # Float results are expected in [0, 1]; anything else is noted
+                if not np.issubdtype(img_display.dtype, np.floating):
                     self.main_window._logMessage(
                         f"Converting image from {img_display.dtype} to uint8 for display.",
                         "info",
                     )
-                    img_display = img_as_ubyte(img_display)
+                img_display = _to_display_uint8(img_display)
 
             # If still not uint8 after conversion attempts, log error
             if img_display.dtype != np.uint8:
@@ -223,6 +329,7 @@ class OperationHandler:
                 )
                 label.setText("Display Error")
                 label.setPixmap(QPixmap())
+                self._display_cache.pop(label, None)
                 return
             else:  # ndim == 2, ensure it's contiguous
                 format = QImage.Format_Grayscale8
@@ -230,20 +337,9 @@ class OperationHandler:
                 if not img_display.flags["C_CONTIGUOUS"]:
                     img_display = np.ascontiguousarray(img_display)
 
-            # Create QImage directly from numpy array data
-            qimage = QImage(img_display.data, width, height, bytes_per_line, format)
-
-            # QImage from data might share memory; create a copy for safety
-            qimage_copy = qimage.copy()
-
-            pixmap = QPixmap.fromImage(qimage_copy)
-
-            # Scale pixmap to fit label while keeping aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+            self._show_display_image(
+                label, image_data, img_display, bytes_per_line, format
             )
-            label.setPixmap(scaled_pixmap)
-            label.setText("")  # Clear placeholder text
 
         except Exception as e:
             import traceback
@@ -252,4 +348,36 @@ class OperationHandler:
                 f"Error displaying image: {e}\n{traceback.format_exc()}", "error"
             )
             label.setText("Display Error")
-            label.setPixmap(QPixmap()) 
\ No newline at end of file
+            label.setPixmap(QPixmap())
+            self._display_cache.pop(label, None)
+
+    def _show_display_image(self, label, image_data, img_display, bytes_per_line, format):
+        """Caches the display QImage for 'label' and shows it scaled to the label."""
+        qimage = _ndarray_to_qimage(img_display, bytes_per_line, format)
+        self._display_cache[label] = (image_data, img_display, qimage)
+        self._smooth_sizes[label] = label.size()
+        label.setPixmap(_scaled_pixmap(qimage, label.size()))
+        label.setText("")  # Clear placeholder text
+
+    def rescale_cached(self, label: QLabel, image_data: np.ndarray, smooth: bool = True) -> bool:
+        """
+        Rescales the image last shown in 'label' to its current size.
+
+        With smooth=False a cheap nearest-neighbour scaling is used, meant for
+        interactive resizing followed by a smooth pass once it settles; a
+        smooth pass at the size already rendered smoothly is skipped.
+
+        Returns False, doing nothing, when 'image_data' is not the image the
+        cache was built from; the caller then needs update_image_display.
+        """
+        cached = self._display_cache.get(label)
+        if cached is None or cached[0] is not image_data:
+            return False
+        size = label.size()
+        if not smooth:
+            self._smooth_sizes[label] = None
+            label.setPixmap(_scaled_pixmap(cached[2], size, Qt.FastTransformation))
+        elif self._smooth_sizes.get(label) != size:
+            self._smooth_sizes[label] = size
+            label.setPixmap(_scaled_pixmap(cached[2], size))
+        return True
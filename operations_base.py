@@ -14,15 +14,37 @@ Each concrete operation class inherits from one of the three base operation clas
 
 import traceback  # Add traceback for error handling in apply
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Union
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
-from skimage import color
+from scipy import ndimage
+from skimage import color, filters
+
+try:
+    import cv2
+except ImportError:  # OpenCV is optional, NumPy paths are used without it
+    cv2 = None
 
 # Type hint for progress callback
 ProgressCallback = Optional[Callable[[int, str], None]]
 
 
+class OperationCancelled(Exception):
+    """
+    Raised from a progress callback to abandon an operation whose result is no
+    longer wanted. It passes through apply() and _report_progress() untouched.
+    """
+
+# skimage's rgb2gray (BT.709) weights in 8-bit fixed point; they sum to 256 so
+# white maps to 255 and every intermediate fits in uint16.
+GRAY_WEIGHTS_Q8 = (54, 183, 19)
+
+# The same weights as a cv2.transform row. Q8 sums are exact in float32 and the
+# 1/1024 bias only breaks .5 ties upwards, so cv2's rounding matches the
+# integer path's (sum + 128) >> 8 for every colour.
+_GRAY_TRANSFORM_Q8 = np.array([w / 256.0 for w in GRAY_WEIGHTS_Q8] + [1.0 / 1024.0])
+
+
 class AbstractOperation(ABC):
     """
     Abstract base class for all image processing operations.
@@ -76,10 +98,16 @@ class AbstractOperation(ABC):
             # Subclass performs its specific logic, including any necessary preprocessing
             result = self._apply_impl(image_data, progress_callback)
             # ---------------------
+            # Results are stored as read-only undo snapshots, so they must never
+            # alias the input; checked explicitly so it also holds under -O
+            if result is not None and np.may_share_memory(result, image_data):
+                result = result.copy()
 
             self._report_progress(progress_callback, 100, f"{op_name} complete.")
             return result
 
+        except OperationCancelled:
+            raise
         except Exception as e:
             error_msg = f"Error in {op_name}: {e}"
             print(error_msg)
@@ -110,6 +138,8 @@ class AbstractOperation(ABC):
             percentage = max(0, min(percentage, 100))
             try:
                 callback(percentage, message)
+            except OperationCancelled:
+                raise
             except Exception as e:
                 print(f"Error in progress callback: {e}")
 
@@ -150,7 +180,11 @@ class AbstractOperation(ABC):
                 self._report_progress(
                     progress_callback, 20, "Converting RGB to grayscale..."
                 )  # Adjust %
-                prep_image = color.rgb2gray(prep_image)
+                if prep_image.dtype == np.uint8:
+                    # Integer fast path; normalised to [0, 1] below like any uint8
+                    prep_image = self._grayscale_u8(prep_image)
+                else:
+                    prep_image = color.rgb2gray(prep_image)
             elif prep_image.ndim == 2:
                 self._report_progress(
                     progress_callback, 20, "Image already grayscale..."
@@ -187,6 +221,31 @@ class AbstractOperation(ABC):
             )
             raise
 
+    def _grayscale_u8(self, image_data: np.ndarray) -> np.ndarray:
+        """
+        Converts a uint8 image to uint8 grayscale using integer arithmetic only.
+        Grayscale input is returned as is; RGBA input ignores the alpha channel.
+        """
+        if image_data.ndim == 2:
+            return image_data
+        if cv2 is not None and image_data.flags.c_contiguous:
+            channels = image_data.shape[2]
+            if channels in (3, 4):
+                # One vectorised pass; any alpha channel gets a zero weight
+                matrix = np.zeros((1, channels + 1))
+                matrix[0, :3] = _GRAY_TRANSFORM_Q8[:3]
+                matrix[0, -1] = _GRAY_TRANSFORM_Q8[3]
+                return cv2.transform(image_data, matrix)
+        # Widen each channel first: uint8 * uint16 scalar stays uint8 (and
+        # wraps) under NumPy 1.x value-based casting
+        w_r, w_g, w_b = GRAY_WEIGHTS_Q8
+        gray = image_data[..., 0].astype(np.uint16) * np.uint16(w_r)
+        gray += image_data[..., 1].astype(np.uint16) * np.uint16(w_g)
+        gray += image_data[..., 2].astype(np.uint16) * np.uint16(w_b)
+        gray += np.uint16(128)  # Round to nearest on the shift below
+        gray >>= np.uint16(8)
+        return gray.astype(np.uint8)
+
     def get_operation_name(self) -> str:
         """Returns the name of the operation (defaulting to class name)."""
         return self.__class__.__name__.replace(
@@ -214,6 +273,7 @@ class BaseEdgeDetectionOperation(AbstractOperation):
     - Threshold parameter for edge detection
     - Gaussian blur via sigma parameter
     - Common preprocessing for grayscale conversion
+    - Subclasses select the filter by setting EDGE_KERNELS
     """
 
     def __init__(self, threshold: float = 0.1, sigma: float = 0.0):
@@ -236,10 +296,26 @@ class BaseEdgeDetectionOperation(AbstractOperation):
         )  # Store None if threshold is None or 0
         self.sigma = float(sigma)
 
-    @abstractmethod
+    # Pair of float32 gradient kernels (one per direction) defining the filter.
+    # Subclasses must set this; see edge_detection_operations for the kernels.
+    EDGE_KERNELS: Tuple[np.ndarray, np.ndarray] = None
+
     def _apply_filter(self, image: np.ndarray) -> np.ndarray:
-        """Applies the specific edge detection filter (e.g., Sobel, Roberts)."""
-        pass
+        """
+        Convolves the float32 image with both EDGE_KERNELS and returns the sum of
+        squared responses, gx**2 + gy**2. The edge magnitude reported by skimage
+        is sqrt(gx**2 + gy**2) / sqrt(2); the square root is deferred to output
+        formatting so thresholding can work on the squared values.
+        """
+        kernel_x, kernel_y = self.EDGE_KERNELS
+        grad_x = np.empty_like(image)
+        grad_y = np.empty_like(image)
+        ndimage.convolve(image, kernel_x, output=grad_x, mode="reflect")
+        ndimage.convolve(image, kernel_y, output=grad_y, mode="reflect")
+        grad_x *= grad_x
+        grad_y *= grad_y
+        grad_x += grad_y
+        return grad_x
 
     def _apply_impl(
         self, image_data: np.ndarray, progress_callback: ProgressCallback
@@ -256,8 +332,6 @@ class BaseEdgeDetectionOperation(AbstractOperation):
             self._report_progress(
                 progress_callback, 40, f"Applying Gaussian blur (sigma={self.sigma})..."
             )
-            from skimage import filters
-
             prepared_image = filters.gaussian(
                 prepared_image, sigma=self.sigma, channel_axis=None
             )
@@ -265,23 +339,27 @@ class BaseEdgeDetectionOperation(AbstractOperation):
         op_name = self.get_operation_name()  # Get name for logging within impl
         self._report_progress(progress_callback, 60, f"Applying {op_name} filter...")
 
-        # Apply the specific filter implemented by the subclass
-        edge_image = self._apply_filter(prepared_image)
+        # Squared gradient of the float32 image, reused in place below
+        energy = self._apply_filter(prepared_image.astype(np.float32))
 
-        # Apply thresholding only if a threshold is provided AND filter output is not already boolean
-        if self.threshold is not None and edge_image.dtype != bool:
+        if self.threshold is not None:
             self._report_progress(
                 progress_callback, 80, f"Applying threshold ({self.threshold})..."
             )
-            edge_image = edge_image > self.threshold
+            # sqrt(energy / 2) > t  <=>  energy > 2 * t * |t|; the |t| keeps a
+            # negative threshold selecting every pixel, as the magnitude would
+            binary = energy > 2.0 * self.threshold * abs(self.threshold)
+            self._report_progress(progress_callback, 90, "Formatting output...")
+            return binary.view(np.uint8) * np.uint8(255)
 
-        # Convert to uint8 for display
+        # Edge magnitude straight to uint8, rounding like img_as_ubyte
         self._report_progress(progress_callback, 90, "Formatting output...")
-        from skimage import util
-
-        output = util.img_as_ubyte(edge_image)
-
-        return output
+        energy *= np.float32(0.5)
+        np.sqrt(energy, out=energy)
+        energy *= np.float32(255.0)
+        energy += np.float32(0.5)
+        np.clip(energy, 0.0, 255.0, out=energy)
+        return energy.astype(np.uint8)
 
 
 class BaseSegmentationOperation(AbstractOperation):
@@ -315,8 +393,77 @@ class BaseConversionOperation(AbstractOperation):
     '_prepare_grayscale' as needed within their '_apply_impl'.
     """
 
+    # Rows per band for _tiled_apply; keeps each band's float temporaries cache-sized
+    TILE_ROWS = 512
+
+    def __init__(self):
+        super().__init__()
+        self._scratch = {}
+
+    def _get_scratch(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Returns an uninitialised buffer that is reused by later calls with the same
+        name, shape and dtype, e.g. for every equally sized band of _tiled_apply.
+
+        Callers must overwrite the buffer before reading it and must not return it
+        as an operation result.
+        """
+        key = (name, tuple(shape), np.dtype(dtype))
+        buffer = self._scratch.get(key)
+        if buffer is None:
+            buffer = self._scratch[key] = np.empty(shape, dtype=dtype)
+        return buffer
+
     def uses_original_source(self) -> bool:
         """
         Conversion operations generally use the original source image by default.
         """
         return True
+
+    def _tiled_apply(
+        self,
+        image_data: np.ndarray,
+        kernel: Callable[[np.ndarray], np.ndarray],
+        tile_rows: int = None,
+        overlap: int = 0,
+    ) -> np.ndarray:
+        """
+        Runs 'kernel' over horizontal bands of the image and stitches the results.
+
+        Each band is processed start to finish before the next one is read, so the
+        kernel's intermediates stay small instead of spanning the whole image.
+
+        Args:
+            image_data: The input image (2D or 3D).
+            kernel: Maps an input band to an output band with the same number of rows.
+            tile_rows: Rows per band (defaults to TILE_ROWS).
+            overlap: Extra context rows read above and below each band, for kernels
+                that look at a neighbourhood. Only the central rows are kept.
+
+        Returns:
+            The stitched output image.
+        """
+        tile_rows = tile_rows or self.TILE_ROWS
+        height = image_data.shape[0]
+        output = None
+        for top in range(0, height, tile_rows):
+            bottom = min(top + tile_rows, height)
+            read_top = max(0, top - overlap)
+            read_bottom = min(height, bottom + overlap)
+            band = kernel(image_data[read_top:read_bottom])
+            if output is None:
+                output = np.empty((height,) + band.shape[1:], dtype=band.dtype)
+            output[top:bottom] = band[top - read_top : bottom - read_top]
+        return output
+
+    def _is_band_safe_grayscale(self, image_data: np.ndarray) -> bool:
+        """
+        Whether _prepare_grayscale gives the same result band-by-band as on the
+        whole image. It does not for non-uint8 integer grayscale input, which is
+        normalised by its own maximum.
+        """
+        return not (
+            image_data.ndim == 2
+            and image_data.dtype.kind in "biu"
+            and image_data.dtype != np.uint8
+        )
@@ -23,9 +23,15 @@ from skimage import color, filters, measure, segmentation, util
 from operations_base import (
     AbstractOperation,
     BaseSegmentationOperation,
+    OperationCancelled,
     ProgressCallback,
 )
 
+# Print per-stage statistics and dump intermediate images to temp_debug_images/
+# for Chan-Vese and Morphological Snakes. Off by default: every probe is an
+# extra full pass over the image and every dump is a PNG encode.
+DEBUG_IMAGES = False
+
 
 # =============================================================================
 # SEGMENTATION OPERATIONS - Inherit from BaseSegmentationOperation
@@ -99,45 +105,48 @@ class ChanVeseOperation(BaseSegmentationOperation):
         self._report_progress(progress_callback, 5, "ChanVese _apply_impl started.")
 
         try:
-            # Ensure debug directory exists
-            debug_dir = "temp_debug_images"
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
+            if DEBUG_IMAGES:
+                # Ensure debug directory exists
+                debug_dir = "temp_debug_images"
+                if not os.path.exists(debug_dir):
+                    os.makedirs(debug_dir)
 
-            print("\n--- CHANVESE DEBUG START ---")
-            print(
-                f"CHANVESE_DEBUG: Input image_data - shape: {image_data.shape}, dtype: {image_data.dtype}, min: {np.min(image_data):.2f}, max: {np.max(image_data):.2f}"
-            )
-            plt.imsave(
-                os.path.join(debug_dir, "chanvese_0_input.png"), image_data, cmap="gray"
-            )
+                print("\n--- CHANVESE DEBUG START ---")
+                print(
+                    f"CHANVESE_DEBUG: Input image_data - shape: {image_data.shape}, dtype: {image_data.dtype}, min: {np.min(image_data):.2f}, max: {np.max(image_data):.2f}"
+                )
+                plt.imsave(
+                    os.path.join(debug_dir, "chanvese_0_input.png"), image_data, cmap="gray"
+                )
 
             self._report_progress(progress_callback, 20, "Preparing grayscale image...")
             prepared_image = self._prepare_grayscale(image_data, progress_callback)
-            print(
-                f"CHANVESE_DEBUG: Prepared grayscale image - shape: {prepared_image.shape}, dtype: {prepared_image.dtype}, min: {np.min(prepared_image):.2f}, max: {np.max(prepared_image):.2f}"
-            )
-            if np.all(prepared_image == prepared_image[0, 0]):
-                print("CHANVESE_DEBUG: Prepared image is uniform!")
-            plt.imsave(
-                os.path.join(debug_dir, "chanvese_1_prepared_gray.png"),
-                prepared_image,
-                cmap="gray",
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"CHANVESE_DEBUG: Prepared grayscale image - shape: {prepared_image.shape}, dtype: {prepared_image.dtype}, min: {np.min(prepared_image):.2f}, max: {np.max(prepared_image):.2f}"
+                )
+                if np.all(prepared_image == prepared_image[0, 0]):
+                    print("CHANVESE_DEBUG: Prepared image is uniform!")
+                plt.imsave(
+                    os.path.join(debug_dir, "chanvese_1_prepared_gray.png"),
+                    prepared_image,
+                    cmap="gray",
+                )
 
             # Start progress indication
             self._report_progress(progress_callback, 40, "Starting Chan-Vese segmentation...")
 
             # Convert image to float type
             prepared_image_float = util.img_as_float(prepared_image).astype(np.float64)
-            print(
-                f"CHANVESE_DEBUG: Prepared image as float - shape: {prepared_image_float.shape}, dtype: {prepared_image_float.dtype}, min: {np.min(prepared_image_float):.2f}, max: {np.max(prepared_image_float):.2f}"
-            )
-            plt.imsave(
-                os.path.join(debug_dir, "chanvese_2_prepared_float.png"),
-                prepared_image_float,
-                cmap="gray",
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"CHANVESE_DEBUG: Prepared image as float - shape: {prepared_image_float.shape}, dtype: {prepared_image_float.dtype}, min: {np.min(prepared_image_float):.2f}, max: {np.max(prepared_image_float):.2f}"
+                )
+                plt.imsave(
+                    os.path.join(debug_dir, "chanvese_2_prepared_float.png"),
+                    prepared_image_float,
+                    cmap="gray",
+                )
 
             # Set up a thread to update progress based on expected iterations
             import threading
@@ -215,26 +224,32 @@ class ChanVeseOperation(BaseSegmentationOperation):
                     f"Chan-Vese completed: {len(energies)} iterations in {elapsed_time:.2f}s"
                 )
                 
-                print(
-                    f"CHANVESE_DEBUG: Chan-Vese algorithm completed with {len(energies)} iterations in {elapsed_time:.2f}s. Final energy: {energies[-1]:.6f}"
-                )
-                print(
-                    f"CHANVESE_DEBUG: Raw segmented_image from chan_vese - shape: {segmented_image.shape}, dtype: {segmented_image.dtype}, min: {np.min(segmented_image)}, max: {np.max(segmented_image)}"
-                )
-                print(
-                    f"CHANVESE_DEBUG: Unique values in raw segmented_image: {np.unique(segmented_image)}"
-                )
+                if DEBUG_IMAGES:
+                    print(
+                        f"CHANVESE_DEBUG: Chan-Vese algorithm completed with {len(energies)} iterations in {elapsed_time:.2f}s. Final energy: {energies[-1]:.6f}"
+                    )
+                    print(
+                        f"CHANVESE_DEBUG: Raw segmented_image from chan_vese - shape: {segmented_image.shape}, dtype: {segmented_image.dtype}, min: {np.min(segmented_image)}, max: {np.max(segmented_image)}"
+                    )
+                    print(
+                        f"CHANVESE_DEBUG: Unique values in raw segmented_image: {np.unique(segmented_image)}"
+                    )
                 
                 # Format the segmented image as uint8
                 result_image = util.img_as_ubyte(segmented_image)
-                print(
-                    f"CHANVESE_DEBUG: Final result_image (ubyte) - shape: {result_image.shape}, dtype: {result_image.dtype}, min: {np.min(result_image)}, max: {np.max(result_image)}"
-                )
+                if DEBUG_IMAGES:
+                    print(
+                        f"CHANVESE_DEBUG: Final result_image (ubyte) - shape: {result_image.shape}, dtype: {result_image.dtype}, min: {np.min(result_image)}, max: {np.max(result_image)}"
+                    )
                 
                 # Final progress update
                 self._report_progress(progress_callback, 100, "Chan-Vese segmentation complete.")
                 
                 return result_image
+            except OperationCancelled:
+                # Superseded run: stop the progress thread and unwind quietly
+                stop_progress_thread.set()
+                raise
             except Exception as e:
                 # Stop the progress thread if still running
                 stop_progress_thread.set()
@@ -247,6 +262,8 @@ class ChanVeseOperation(BaseSegmentationOperation):
                 self._report_progress(progress_callback, 100, f"Error: {e}")
                 raise
 
+        except OperationCancelled:
+            raise
         except Exception as e:
             print(f"CHANVESE_DEBUG: EXCEPTION in _apply_impl: {e}")
             import traceback
@@ -287,43 +304,46 @@ class MorphSnakesOperation(BaseSegmentationOperation):
         self._report_progress(progress_callback, 5, "MorphSnakes _apply_impl started.")
 
         try:
-            # Ensure debug directory exists
-            debug_dir = "temp_debug_images"
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
+            if DEBUG_IMAGES:
+                # Ensure debug directory exists
+                debug_dir = "temp_debug_images"
+                if not os.path.exists(debug_dir):
+                    os.makedirs(debug_dir)
 
-            print("\n--- MORPHSNAKES DEBUG START ---")
-            print(
-                f"MORPHSNAKES_DEBUG: Input image_data - shape: {image_data.shape}, dtype: {image_data.dtype}, min: {np.min(image_data):.2f}, max: {np.max(image_data):.2f}"
-            )
-            plt.imsave(
-                os.path.join(debug_dir, "morphsnakes_0_input.png"),
-                image_data,
-                cmap="gray",
-            )
+                print("\n--- MORPHSNAKES DEBUG START ---")
+                print(
+                    f"MORPHSNAKES_DEBUG: Input image_data - shape: {image_data.shape}, dtype: {image_data.dtype}, min: {np.min(image_data):.2f}, max: {np.max(image_data):.2f}"
+                )
+                plt.imsave(
+                    os.path.join(debug_dir, "morphsnakes_0_input.png"),
+                    image_data,
+                    cmap="gray",
+                )
 
             self._report_progress(progress_callback, 20, "Preparing grayscale image...")
             prepared_image = self._prepare_grayscale(image_data, progress_callback)
-            print(
-                f"MORPHSNAKES_DEBUG: Prepared grayscale image - shape: {prepared_image.shape}, dtype: {prepared_image.dtype}, min: {np.min(prepared_image):.2f}, max: {np.max(prepared_image):.2f}"
-            )
-            if np.all(prepared_image == prepared_image[0, 0]):
-                print("MORPHSNAKES_DEBUG: Prepared image is uniform!")
-            plt.imsave(
-                os.path.join(debug_dir, "morphsnakes_1_prepared_gray.png"),
-                prepared_image,
-                cmap="gray",
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"MORPHSNAKES_DEBUG: Prepared grayscale image - shape: {prepared_image.shape}, dtype: {prepared_image.dtype}, min: {np.min(prepared_image):.2f}, max: {np.max(prepared_image):.2f}"
+                )
+                if np.all(prepared_image == prepared_image[0, 0]):
+                    print("MORPHSNAKES_DEBUG: Prepared image is uniform!")
+                plt.imsave(
+                    os.path.join(debug_dir, "morphsnakes_1_prepared_gray.png"),
+                    prepared_image,
+                    cmap="gray",
+                )
 
             prepared_image_float = util.img_as_float(prepared_image)
-            print(
-                f"MORPHSNAKES_DEBUG: Prepared image as float - shape: {prepared_image_float.shape}, dtype: {prepared_image_float.dtype}, min: {np.min(prepared_image_float):.2f}, max: {np.max(prepared_image_float):.2f}"
-            )
-            plt.imsave(
-                os.path.join(debug_dir, "morphsnakes_2_prepared_float.png"),
-                prepared_image_float,
-                cmap="gray",
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"MORPHSNAKES_DEBUG: Prepared image as float - shape: {prepared_image_float.shape}, dtype: {prepared_image_float.dtype}, min: {np.min(prepared_image_float):.2f}, max: {np.max(prepared_image_float):.2f}"
+                )
+                plt.imsave(
+                    os.path.join(debug_dir, "morphsnakes_2_prepared_float.png"),
+                    prepared_image_float,
+                    cmap="gray",
+                )
 
             self._report_progress(
                 progress_callback,
@@ -363,46 +383,51 @@ class MorphSnakesOperation(BaseSegmentationOperation):
                 iter_callback=progress_callback_wrapper  # İlerleme geri çağrısını ekle
             )
 
-            print(
-                f"MORPHSNAKES_DEBUG: Raw segmented_image from morph_chan_vese - shape: {segmented_image.shape}, dtype: {segmented_image.dtype}, min: {np.min(segmented_image)}, max: {np.max(segmented_image)}"
-            )
-            print(
-                f"MORPHSNAKES_DEBUG: Unique values in raw segmented_image: {np.unique(segmented_image)}"
-            )
-            plt.imsave(
-                os.path.join(debug_dir, "morphsnakes_4_segmented_ls_boolean.png"),
-                segmented_image.astype(np.uint8) * 255,
-                cmap="gray",
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"MORPHSNAKES_DEBUG: Raw segmented_image from morph_chan_vese - shape: {segmented_image.shape}, dtype: {segmented_image.dtype}, min: {np.min(segmented_image)}, max: {np.max(segmented_image)}"
+                )
+                print(
+                    f"MORPHSNAKES_DEBUG: Unique values in raw segmented_image: {np.unique(segmented_image)}"
+                )
+                plt.imsave(
+                    os.path.join(debug_dir, "morphsnakes_4_segmented_ls_boolean.png"),
+                    segmented_image.astype(np.uint8) * 255,
+                    cmap="gray",
+                )
 
             # Explicitly convert to boolean ensure correct scaling by img_as_ubyte
             segmented_ls_bool = segmented_image.astype(bool)
-            print(
-                f"MORPHSNAKES_DEBUG: segmented_ls_bool - shape: {segmented_ls_bool.shape}, dtype: {segmented_ls_bool.dtype}, unique: {np.unique(segmented_ls_bool)}"
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"MORPHSNAKES_DEBUG: segmented_ls_bool - shape: {segmented_ls_bool.shape}, dtype: {segmented_ls_bool.dtype}, unique: {np.unique(segmented_ls_bool)}"
+                )
 
             result_image = util.img_as_ubyte(segmented_ls_bool)
-            print(
-                f"MORPHSNAKES_DEBUG: Final result_image (ubyte) - shape: {result_image.shape}, dtype: {result_image.dtype}, min: {np.min(result_image)}, max: {np.max(result_image)}"
-            )
+            if DEBUG_IMAGES:
+                print(
+                    f"MORPHSNAKES_DEBUG: Final result_image (ubyte) - shape: {result_image.shape}, dtype: {result_image.dtype}, min: {np.min(result_image)}, max: {np.max(result_image)}"
+                )
 
-            # Check if the result is all black or all white
-            if np.all(result_image == 0):
-                print("MORPHSNAKES_DEBUG: Final image is all black!")
-            if np.all(result_image == 255):
-                print("MORPHSNAKES_DEBUG: Final image is all white!")
+                # Check if the result is all black or all white
+                if np.all(result_image == 0):
+                    print("MORPHSNAKES_DEBUG: Final image is all black!")
+                if np.all(result_image == 255):
+                    print("MORPHSNAKES_DEBUG: Final image is all white!")
 
-            plt.imsave(
-                os.path.join(debug_dir, "morphsnakes_5_final_ubyte.png"),
-                result_image,
-                cmap="gray",
-            )
-            print("--- MORPHSNAKES DEBUG END ---\n")
+                plt.imsave(
+                    os.path.join(debug_dir, "morphsnakes_5_final_ubyte.png"),
+                    result_image,
+                    cmap="gray",
+                )
+                print("--- MORPHSNAKES DEBUG END ---\n")
 
             self._report_progress(
                 progress_callback, 100, "Morphological Snakes segmentation complete."
             )
             return result_image
+        except OperationCancelled:
+            raise
         except Exception as e:
             print(f"MORPHSNAKES_DEBUG: EXCEPTION in _apply_impl: {e}")
             import traceback
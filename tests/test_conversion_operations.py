@@ -0,0 +1,89 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from skimage.filters import threshold_local
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conversion_operations  # noqa: E402
+from conversion_operations import AdaptiveThresholdOperation  # noqa: E402
+
+# An offset no window mean can equal exactly, so float rounding never flips a
+# comparison between the box filter, the summed-area table and skimage
+CONSTANT = 0.001
+
+
+@pytest.fixture(params=["cv2", "sat"])
+def mean_method(request, monkeypatch):
+    if request.param == "cv2":
+        if conversion_operations.cv2 is None:
+            pytest.skip("OpenCV is not installed")
+    else:
+        monkeypatch.setattr(conversion_operations, "cv2", None)
+    return request.param
+
+
+def _tall_images():
+    rng = np.random.default_rng(3)
+    rows = AdaptiveThresholdOperation.TILE_ROWS * 2 + 77  # Three bands, ragged last
+    return {
+        "rgb-uint8": rng.integers(0, 256, (rows, 41, 3), dtype=np.uint8),
+        "gray-float": rng.random((rows, 41)),
+    }
+
+
+@pytest.mark.parametrize("name", ["rgb-uint8", "gray-float"])
+def test_adaptive_threshold_matches_threshold_local(name, mean_method):
+    image = _tall_images()[name]
+    operation = AdaptiveThresholdOperation(block_size=35, constant=CONSTANT)
+    if image.dtype == np.uint8:
+        gray = operation._grayscale_u8(image)
+        offset = CONSTANT * 255.0
+    else:
+        gray = operation._prepare_grayscale(image)
+        offset = CONSTANT
+    expected = (gray > threshold_local(gray, 35, method="mean", offset=offset)) * 255
+
+    # Tiled through apply(), then the whole image as a single band
+    tiled = operation.apply(image)
+    whole = operation._threshold_band(image)
+
+    np.testing.assert_array_equal(tiled, expected)
+    np.testing.assert_array_equal(whole, expected)
+
+
+def test_local_mean_paths_agree(monkeypatch):
+    if conversion_operations.cv2 is None:
+        pytest.skip("OpenCV is not installed")
+    gray = np.random.default_rng(5).integers(0, 256, (600, 53), dtype=np.uint8)
+    operation = AdaptiveThresholdOperation(block_size=21)
+    # Small SAT blocks so the row-block carry runs many times
+    operation.SAT_BLOCK_BYTES = 4096
+
+    box_filter = operation._local_mean(gray).copy()
+    monkeypatch.setattr(conversion_operations, "cv2", None)
+    summed_area = operation._local_mean(gray)
+
+    np.testing.assert_allclose(summed_area, box_filter, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(
+        summed_area, threshold_local(gray, 21, method="mean"), rtol=0, atol=1e-9
+    )
+
+
+def test_tiled_local_mean_has_no_seams(mean_method):
+    image = _tall_images()["rgb-uint8"]
+    operation = AdaptiveThresholdOperation(block_size=35)
+    gray = operation._grayscale_u8(image)
+    # Have each band return its local mean, so band seams show up directly
+    # instead of only when they flip a thresholded pixel
+    operation._threshold_band = lambda band: operation._local_mean(
+        operation._grayscale_u8(band)
+    ).copy()
+
+    tiled_mean = operation._apply_impl(image, None)
+
+    np.testing.assert_allclose(
+        tiled_mean, threshold_local(gray, 35, method="mean"), rtol=0, atol=1e-9
+    )
@@ -0,0 +1,121 @@
+import os
+import random
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import edit  # noqa: E402
+from edit import ImageHistory, _EncodedImage  # noqa: E402
+
+
+def _assert_same_state(entry, expected):
+    image, title = expected
+    assert entry.title == title
+    if image is None:
+        assert entry.image is None
+    else:
+        assert entry.image.dtype == image.dtype
+        np.testing.assert_array_equal(entry.image, image)
+
+
+def _random_state(rng, previous):
+    choice = rng.integers(6)
+    if choice == 0:
+        return None
+    if choice == 1:
+        return rng.integers(0, 256, (24, 32, 3), dtype=np.uint8)
+    if choice == 2 and previous is not None:
+        # Same shape and dtype as the state below, so it is stored as a delta
+        changed = previous.copy()
+        changed.flat[rng.integers(changed.size)] = rng.integers(256)
+        return changed
+    if choice == 3:
+        return rng.random((24, 32))
+    if choice == 4:
+        return np.where(rng.random((20, 30)) > 0.5, 255, 0).astype(np.uint8)
+    return rng.integers(0, 256, (rng.integers(5, 20), 17), dtype=np.uint8)
+
+
+def test_random_push_pop_matches_list_model():
+    rng = np.random.default_rng(1234)
+    pick = random.Random(1234)
+    history = ImageHistory(maxlen=6)
+    model = []
+
+    for step in range(2000):
+        if model and pick.random() < 0.45:
+            _assert_same_state(history.pop(), model.pop())
+        else:
+            image = _random_state(rng, model[-1][0] if model else None)
+            title = f"state {step}"
+            history.append(image, title)
+            model.append((image, title))
+            del model[: -history.maxlen]
+        assert len(history) == len(model)
+        if model:
+            _assert_same_state(history[-1], model[-1])
+
+    while model:
+        _assert_same_state(history.pop(), model.pop())
+    assert len(history) == 0
+
+
+@pytest.fixture(params=["lz4", "zlib"])
+def codec(request, monkeypatch):
+    if request.param == "lz4":
+        if edit.lz4_block is None:
+            pytest.skip("lz4 is not installed")
+    else:
+        # Force the fallback even when lz4 is available
+        monkeypatch.setattr(edit, "lz4_block", None)
+    return request.param
+
+
+def test_encode_decode_round_trip(codec):
+    rng = np.random.default_rng(7)
+    base = rng.integers(0, 256, (24, 32, 3), dtype=np.uint8)
+    edited = base.copy()
+    edited[5:10, 5:10] = 0
+    states = [
+        (base, "raw"),  # Shape differs from the state above
+        (rng.random((16, 16)), "raw"),
+        (np.where(rng.random((16, 16)) > 0.5, 255, 0).astype(np.uint8), "bits"),
+        (None, None),
+        (base, "delta"),  # Same shape and dtype as the state above
+        (edited, "raw"),
+        (np.zeros((3, 3), dtype=np.uint8), None),
+        (np.ones((3, 3), dtype=np.uint8), None),
+    ]
+    history = ImageHistory(maxlen=len(states))
+    for index, (image, _) in enumerate(states):
+        history.append(image, f"state {index}")
+
+    hot = len(states) - ImageHistory.HOT_ENTRIES
+    for index, (image, kind) in enumerate(states):
+        stored = history[index].image
+        if index >= hot or image is None:
+            # The top entries stay as the pushed arrays; None is never encoded
+            assert stored is image
+            continue
+        assert isinstance(stored, _EncodedImage)
+        assert stored.kind == kind
+        if codec == "zlib":
+            zlib.decompress(stored.blob)
+
+    # Every pop warms the next entry back into a plain array
+    for index in reversed(range(len(states))):
+        entry = history.pop()
+        assert entry.title == f"state {index}"
+        image = states[index][0]
+        if image is None:
+            assert entry.image is None
+        else:
+            assert isinstance(entry.image, np.ndarray)
+            assert entry.image.dtype == image.dtype
+            np.testing.assert_array_equal(entry.image, image)
+        if len(history) >= ImageHistory.HOT_ENTRIES:
+            assert not isinstance(history[-ImageHistory.HOT_ENTRIES].image, _EncodedImage)
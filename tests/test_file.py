@@ -0,0 +1,46 @@
+import os
+import sys
+
+import imageio
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file import _SaveTask  # noqa: E402
+
+
+def _save_and_read(image, tmp_path, name="out.png"):
+    path = str(tmp_path / name)
+    results = []
+    task = _SaveTask(image, path, assume_uint8=image.dtype == np.uint8)
+    task.signals.finished.connect(lambda ok, error: results.append((ok, error)))
+    task.run()
+    assert results == [(True, "")]
+    return imageio.v3.imread(path)
+
+
+def test_uint8_round_trip(tmp_path):
+    image = np.random.default_rng(0).integers(0, 256, (16, 12, 3), dtype=np.uint8)
+
+    np.testing.assert_array_equal(_save_and_read(image, tmp_path), image)
+
+
+@pytest.mark.parametrize(
+    "image, expected",
+    [
+        (np.array([[0.0, 0.5, 1.0]]), [[0, 127, 255]]),
+        (np.array([[0.0, 127.0, 255.0]], dtype=np.float32), [[0, 127, 255]]),
+        (np.array([[-0.1, 0.5, 1.2, np.nan]]), [[0, 0, 1, 0]]),
+        (np.array([[-20.0, 300.0, np.nan]]), [[0, 255, 0]]),
+    ],
+    ids=["unit-range", "byte-range", "out-of-unit-range", "out-of-byte-range"],
+)
+def test_float_save_is_clipped(image, expected, tmp_path):
+    np.testing.assert_array_equal(_save_and_read(image, tmp_path), expected)
+
+
+def test_bool_saves_as_0_and_255(tmp_path):
+    image = np.array([[True, False]])
+
+    np.testing.assert_array_equal(_save_and_read(image, tmp_path), [[255, 0]])
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from skimage.util import img_as_ubyte
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from operation_handler import _to_display_uint8  # noqa: E402
+
+
+def _full_range(dtype):
+    info = np.iinfo(dtype)
+    return np.linspace(info.min, info.max, 4097).astype(dtype)
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        np.arange(-128, 128, dtype=np.int8),
+        _full_range(np.int16),
+        _full_range(np.int32),
+        _full_range(np.uint16),
+        np.array([True, False, True]),
+        np.random.default_rng(0).random(4096),
+        np.random.default_rng(1).random(4096).astype(np.float32),
+        np.array([0.0, 0.5 / 255, 1.5 / 255, 0.5, 254.5 / 255, 1.0]),
+    ],
+    ids=["int8", "int16", "int32", "uint16", "bool", "float64", "float32", "float-halves"],
+)
+def test_matches_img_as_ubyte(image):
+    result = _to_display_uint8(image)
+
+    assert result.dtype == np.uint8
+    np.testing.assert_array_equal(result, img_as_ubyte(image))
+
+
+def test_float_out_of_range_is_clipped():
+    image = np.array([-0.5, 1.5])
+
+    np.testing.assert_array_equal(_to_display_uint8(image), [0, 255])
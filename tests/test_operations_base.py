@@ -0,0 +1,42 @@
+import os
+import sys
+
+import numpy as np
+from skimage import color
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from operations_base import BaseConversionOperation  # noqa: E402
+
+
+class _PassThroughOperation(BaseConversionOperation):
+    def _apply_impl(self, image_data, progress_callback):
+        return image_data.copy()
+
+
+def test_grayscale_u8_matches_float_bt709_on_rgba():
+    rng = np.random.default_rng(0)
+    rgba = rng.integers(0, 256, size=(64, 48, 4), dtype=np.uint8)
+    expected = np.rint(color.rgb2gray(rgba[:, :, :3]) * 255.0)
+
+    operation = _PassThroughOperation()
+    # The RGBA slice is non-contiguous, so this takes the NumPy path even with cv2
+    gray = operation._grayscale_u8(rgba[:, :, :3])
+
+    assert gray.dtype == np.uint8
+    assert gray.shape == rgba.shape[:2]
+    assert np.abs(gray.astype(np.int16) - expected).max() <= 1
+
+
+class _ViewOperation(BaseConversionOperation):
+    def _apply_impl(self, image_data, progress_callback):
+        return image_data[:, :, 0]
+
+
+def test_apply_never_returns_a_view_of_its_input():
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    result = _ViewOperation().apply(image)
+
+    assert not np.may_share_memory(result, image)
+    np.testing.assert_array_equal(result, image[:, :, 0])
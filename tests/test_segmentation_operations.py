@@ -0,0 +1,47 @@
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from operations_base import OperationCancelled  # noqa: E402
+from segmentation_operations import ChanVeseOperation, MorphSnakesOperation  # noqa: E402
+
+
+def _cancelling_callback(cancel_at, messages):
+    """Records progress and cancels, like OperationRunnable, once 'cancel_at' is reached."""
+    caller = threading.current_thread()
+
+    def callback(percentage, message):
+        messages.append(message)
+        # Only the thread running the operation unwinds, not progress helpers
+        if percentage >= cancel_at and threading.current_thread() is caller:
+            raise OperationCancelled()
+
+    return callback
+
+
+@pytest.mark.parametrize(
+    "operation, cancel_at",
+    [
+        (ChanVeseOperation(max_iter=10), 20),
+        (ChanVeseOperation(max_iter=10), 95),  # After the algorithm, inside its try block
+        (MorphSnakesOperation(iterations=10), 20),
+        (MorphSnakesOperation(iterations=10), 41),  # From the per-iteration callback
+    ],
+    ids=["chan-vese-prepare", "chan-vese-finished", "morph-snakes-prepare", "morph-snakes-iterating"],
+)
+def test_cancelled_segmentation_stops_quietly(operation, cancel_at, capsys):
+    image = np.random.default_rng(0).integers(0, 256, (40, 40, 3), dtype=np.uint8)
+    messages = []
+
+    with pytest.raises(OperationCancelled):
+        operation.apply(image, _cancelling_callback(cancel_at, messages))
+
+    output = capsys.readouterr().out
+    assert "EXCEPTION" not in output
+    assert "Traceback" not in output
+    assert not any(message.startswith("Error") for message in messages)
@@ -1,19 +1,51 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+import threading
 
-class WorkerThread(QThread):
-    """Runs an operation in a separate thread."""
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
+from operations_base import OperationCancelled
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by OperationRunnable (a QRunnable cannot emit itself)."""
+
+    progress = pyqtSignal(int, str)
     operation_complete = pyqtSignal(object, object, object)
 
-    def __init__(self, operation_instance, image_data, progress_callback):
+
+class OperationRunnable(QRunnable):
+    """
+    Runs an operation on a QThreadPool thread.
+
+    Progress and the result are emitted through 'signals', so connected slots run
+    on the GUI thread. 'is_current' is checked before the operation starts and on
+    every progress report; once it returns False the run is abandoned and nothing
+    more is emitted.
+    """
+
+    def __init__(self, operation_instance, image_data, is_current):
         super().__init__()
         self.operation = operation_instance
         self.image_data = image_data
-        self.progress_callback = progress_callback
+        self.is_current = is_current
+        self.signals = WorkerSignals()
+        self._run_thread = None
+
+    def _on_progress(self, percentage, message):
+        if self.is_current():
+            self.signals.progress.emit(percentage, message)
+        elif threading.current_thread() is self._run_thread:
+            # Only unwind the pool thread itself, not helper threads of the
+            # operation that happen to report progress
+            raise OperationCancelled()
 
     def run(self):
+        self._run_thread = threading.current_thread()
+        if not self.is_current():
+            return
         try:
-            result = self.operation.apply(self.image_data, self.progress_callback)
-            self.operation_complete.emit(result, self.operation, None)
+            result = self.operation.apply(self.image_data, self._on_progress)
+            self.signals.operation_complete.emit(result, self.operation, None)
+        except OperationCancelled:
+            pass
         except Exception as e:
-            self.operation_complete.emit(None, self.operation, str(e)) 
\ No newline at end of file
+            self.signals.operation_complete.emit(None, self.operation, str(e))